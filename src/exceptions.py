@@ -32,9 +32,15 @@ class TimeoutError(DatabaseError):
 
 
 class ValidationError(Exception):
-    """Raised when validation fails."""
+    """Raised when validation fails.
 
-    pass
+    The optional code identifies the kind of failure (e.g. SYNTAX_ERROR, TCL_NOT_ALLOWED,
+    EMPTY_QUERY) so callers don't have to match on the message.
+    """
+
+    def __init__(self, message: str, code: str = ""):
+        self.code = code
+        super().__init__(message)
 
 
 class SafetyError(Exception):
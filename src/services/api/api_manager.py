@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from enum import Enum
 from typing import Any
 
@@ -31,6 +32,9 @@ class SupabaseApiManager:
 
     _instance: SupabaseApiManager | None = None
 
+    # Matches path placeholders such as {ref} or {function_slug}
+    _PATH_PARAM_RE = re.compile(r"\{([^}]+)\}")
+
     def __init__(
         self,
         api_client: ManagementAPIClient,
@@ -162,24 +166,16 @@ class SupabaseApiManager:
 
         logger.info(f"Replacing path parameters in path: {working_params}")
 
-        # Replace all placeholders in the path
-        for key, value in working_params.items():
-            placeholder = "{" + key + "}"
-            if placeholder in path:
-                path = path.replace(placeholder, str(value))
-                logger.debug(f"Replaced {placeholder} with {value}")
-
-        # Check if any placeholders remain
-        import re
-
-        remaining_placeholders = re.findall(r"\{([^}]+)\}", path)
-        if remaining_placeholders:
+        # Check that every placeholder in the path has a value
+        missing_placeholders = [name for name in self._PATH_PARAM_RE.findall(path) if name not in working_params]
+        if missing_placeholders:
             raise ValueError(
-                f"Missing path parameters: {', '.join(remaining_placeholders)}. "
+                f"Missing path parameters: {', '.join(missing_placeholders)}. "
                 f"Please provide values for these placeholders in the path_params dictionary."
             )
 
-        return path
+        # Replace all placeholders in a single pass
+        return self._PATH_PARAM_RE.sub(lambda match: str(working_params[match.group(1)]), path)
 
     async def execute_request(
         self,
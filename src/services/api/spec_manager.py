@@ -44,6 +44,7 @@ class ApiSpecManager:
         self.spec: dict[str, Any] | None = None
         self._paths_cache: dict[str, dict[str, str]] | None = None
         self._domains_cache: list[str] | None = None
+        self._domain_paths_cache: dict[str, dict[str, dict[str, str]]] | None = None
 
     async def _fetch_remote_spec(self) -> dict[str, Any] | None:
         """
@@ -119,15 +120,11 @@ class ApiSpecManager:
         except ValueError as e:
             raise ValueError(f"Invalid domain: {domain}") from e
 
-        domain_paths: dict[str, dict[str, str]] = {}
-        if self.spec:
-            for path, methods in self.spec.get("paths", {}).items():
-                for method, details in methods.items():
-                    if valid_domain in details.get("tags", []):
-                        if path not in domain_paths:
-                            domain_paths[path] = {}
-                        domain_paths[path][method] = details.get("operationId", "")
-        return domain_paths
+        if self._domain_paths_cache is None:
+            return {}
+        # Copy so callers can't mutate the shared cache
+        domain_paths = self._domain_paths_cache.get(valid_domain, {})
+        return {path: dict(methods) for path, methods in domain_paths.items()}
 
     def get_all_domains(self) -> list[str]:
         """
@@ -186,7 +183,7 @@ class ApiSpecManager:
     def _build_caches(self) -> None:
         """
         Build internal caches for faster lookups.
-        This populates _paths_cache and _domains_cache.
+        This populates _paths_cache, _domains_cache and _domain_paths_cache.
         """
         if self.spec is None:
             logger.error("Cannot build caches: OpenAPI spec not loaded")
@@ -194,21 +191,24 @@ class ApiSpecManager:
 
         # Build paths cache
         paths_cache: dict[str, dict[str, str]] = {}
-        domains_set = set()
+        domain_paths_cache: dict[str, dict[str, dict[str, str]]] = {}
 
         for path, methods in self.spec.get("paths", {}).items():
             for method, details in methods.items():
+                operation_id = details.get("operationId", "")
+
                 # Add to paths cache
                 if path not in paths_cache:
                     paths_cache[path] = {}
-                paths_cache[path][method] = details.get("operationId", "")
+                paths_cache[path][method] = operation_id
 
-                # Collect domains (tags)
+                # Index the operation under each of its domains (tags)
                 for tag in details.get("tags", []):
-                    domains_set.add(tag)
+                    domain_paths_cache.setdefault(tag, {}).setdefault(path, {})[method] = operation_id
 
         self._paths_cache = paths_cache
-        self._domains_cache = sorted(list(domains_set))
+        self._domain_paths_cache = domain_paths_cache
+        self._domains_cache = sorted(domain_paths_cache)
 
 
 # Example usage (assuming you have an instance of ApiSpecManager called 'spec_manager'):
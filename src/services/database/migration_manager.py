@@ -10,6 +10,42 @@ from src.services.database.sql.models import (
     ValidatedStatement,
 )
 
+# Patterns are compiled once at import instead of on every extraction call
+_SPECIAL_CHARS_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_CREATE_TABLE_RE = re.compile(r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+_ALTER_TABLE_RE = re.compile(r"ALTER\s+TABLE\s+(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+_DROP_TABLE_RE = re.compile(r"DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+_DML_TABLE_RE = re.compile(r"(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM)\s+(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+_FUNCTION_RE = re.compile(r"(?:CREATE|ALTER|DROP)\s+(?:OR\s+REPLACE\s+)?FUNCTION\s+(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+_TRIGGER_RE = re.compile(r"(?:CREATE|ALTER|DROP)\s+TRIGGER\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.IGNORECASE)
+_VIEW_RE = re.compile(r"(?:CREATE|ALTER|DROP)\s+(?:OR\s+REPLACE\s+)?VIEW\s+(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+_INDEX_RE = re.compile(r"(?:CREATE|DROP)\s+INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+_SEQUENCE_RE = re.compile(
+    r"(?:CREATE|ALTER|DROP)\s+SEQUENCE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)", re.IGNORECASE
+)
+_CONSTRAINT_RE = re.compile(r"CONSTRAINT\s+(\w+)", re.IGNORECASE)
+_UPDATE_SET_RE = re.compile(r"UPDATE\s+(?:\w+\.)?(?:\w+)\s+SET\s+([\w\s,=]+)\s+WHERE", re.IGNORECASE)
+_PRIVILEGE_RE = re.compile(r"(?:GRANT|REVOKE)\s+([\w\s,]+)\s+ON", re.IGNORECASE)
+_DCL_OBJECT_RE = re.compile(r"ON\s+(?:TABLE\s+)?(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+_MATERIALIZED_VIEW_RE = re.compile(
+    r"(?:CREATE|ALTER|DROP|REFRESH)\s+(?:MATERIALIZED\s+VIEW)\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)",
+    re.IGNORECASE,
+)
+_FOREIGN_TABLE_RE = re.compile(
+    r"(?:CREATE|ALTER|DROP)\s+(?:FOREIGN\s+TABLE)\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)", re.IGNORECASE
+)
+_EXTENSION_RE = re.compile(r"(?:CREATE|ALTER|DROP)\s+EXTENSION\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.IGNORECASE)
+_TYPE_RE = re.compile(r"(?:CREATE|ALTER|DROP)\s+TYPE\s+(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+_DOMAIN_RE = re.compile(r"(?:CREATE|ALTER|DROP)\s+DOMAIN\s+(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+_SET_COLUMN_RE = re.compile(r"(\w+)\s*=")
+_GENERIC_OBJECT_PATTERNS = (
+    re.compile(r"(?:CREATE|ALTER|DROP)\s+(?:\w+\s+)+(?:(\w+)\.)?(\w+)", re.IGNORECASE),  # General DDL pattern
+    re.compile(r"ON\s+(?:(\w+)\.)?(\w+)", re.IGNORECASE),  # ON clause
+    re.compile(r"FROM\s+(?:(\w+)\.)?(\w+)", re.IGNORECASE),  # FROM clause
+    re.compile(r"INTO\s+(?:(\w+)\.)?(\w+)", re.IGNORECASE),  # INTO clause
+)
+
 
 class MigrationManager:
     """Responsible for preparing migration scripts without executing them."""
@@ -72,8 +108,8 @@ class MigrationManager:
             str: Sanitized migration name
         """
         # Remove special characters and replace spaces with underscores
-        sanitized_name = re.sub(r"[^\w\s]", "", name).lower()
-        sanitized_name = re.sub(r"\s+", "_", sanitized_name)
+        sanitized_name = _SPECIAL_CHARS_RE.sub("", name).lower()
+        sanitized_name = _WHITESPACE_RE.sub("_", sanitized_name)
 
         # Ensure the name is not too long (max 100 chars)
         if len(sanitized_name) > 100:
@@ -179,8 +215,13 @@ class MigrationManager:
             elif object_type == "type" and statement.query:
                 object_name = self._extract_type_name(statement.query)
             elif statement.query:
-                # For other object types, use a generic extraction
-                object_name = self._extract_generic_object_name(statement.query)
+                # Statements on a relation report the relation name as their object type, so try the table
+                # patterns before the generic extraction
+                table_name = self._extract_table_name(statement.query)
+                if table_name != "unknown":
+                    object_name = table_name
+                else:
+                    object_name = self._extract_generic_object_name(statement.query)
 
         # Combine parts into a descriptive name
         name = f"{command}_{object_type}_{schema}_{object_name}"
@@ -257,25 +298,23 @@ class MigrationManager:
 
         # Simple regex-based extraction for demonstration
         # In a real implementation, this would use more sophisticated parsing
-        import re
-
         # For CREATE TABLE
-        match = re.search(r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)", query, re.IGNORECASE)
+        match = _CREATE_TABLE_RE.search(query)
         if match:
             return match.group(2)
 
         # For ALTER TABLE
-        match = re.search(r"ALTER\s+TABLE\s+(?:(\w+)\.)?(\w+)", query, re.IGNORECASE)
+        match = _ALTER_TABLE_RE.search(query)
         if match:
             return match.group(2)
 
         # For DROP TABLE
-        match = re.search(r"DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)", query, re.IGNORECASE)
+        match = _DROP_TABLE_RE.search(query)
         if match:
             return match.group(2)
 
         # For INSERT, UPDATE, DELETE
-        match = re.search(r"(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM)\s+(?:(\w+)\.)?(\w+)", query, re.IGNORECASE)
+        match = _DML_TABLE_RE.search(query)
         if match:
             return match.group(2)
 
@@ -286,11 +325,7 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        match = re.search(
-            r"(?:CREATE|ALTER|DROP)\s+(?:OR\s+REPLACE\s+)?FUNCTION\s+(?:(\w+)\.)?(\w+)", query, re.IGNORECASE
-        )
+        match = _FUNCTION_RE.search(query)
         if match:
             return match.group(2)
 
@@ -301,9 +336,7 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        match = re.search(r"(?:CREATE|ALTER|DROP)\s+TRIGGER\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", query, re.IGNORECASE)
+        match = _TRIGGER_RE.search(query)
         if match:
             return match.group(1)
 
@@ -314,9 +347,7 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        match = re.search(r"(?:CREATE|ALTER|DROP)\s+(?:OR\s+REPLACE\s+)?VIEW\s+(?:(\w+)\.)?(\w+)", query, re.IGNORECASE)
+        match = _VIEW_RE.search(query)
         if match:
             return match.group(2)
 
@@ -327,9 +358,7 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        match = re.search(r"(?:CREATE|DROP)\s+INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)", query, re.IGNORECASE)
+        match = _INDEX_RE.search(query)
         if match:
             return match.group(2)
 
@@ -340,11 +369,7 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        match = re.search(
-            r"(?:CREATE|ALTER|DROP)\s+SEQUENCE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)", query, re.IGNORECASE
-        )
+        match = _SEQUENCE_RE.search(query)
         if match:
             return match.group(2)
 
@@ -355,9 +380,7 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        match = re.search(r"CONSTRAINT\s+(\w+)", query, re.IGNORECASE)
+        match = _CONSTRAINT_RE.search(query)
         if match:
             return match.group(1)
 
@@ -368,14 +391,12 @@ class MigrationManager:
         if not query:
             return ""
 
-        import re
-
         # This is a simplified approach - a real implementation would use proper SQL parsing
-        match = re.search(r"UPDATE\s+(?:\w+\.)?(?:\w+)\s+SET\s+([\w\s,=]+)\s+WHERE", query, re.IGNORECASE)
+        match = _UPDATE_SET_RE.search(query)
         if match:
             # Extract column names from the SET clause
             set_clause = match.group(1)
-            columns = re.findall(r"(\w+)\s*=", set_clause)
+            columns = _SET_COLUMN_RE.findall(set_clause)
             if columns and len(columns) <= 3:  # Limit to 3 columns to keep name reasonable
                 return "_".join(columns)
             elif columns:
@@ -388,9 +409,7 @@ class MigrationManager:
         if not query:
             return "privilege"
 
-        import re
-
-        match = re.search(r"(?:GRANT|REVOKE)\s+([\w\s,]+)\s+ON", query, re.IGNORECASE)
+        match = _PRIVILEGE_RE.search(query)
         if match:
             privileges = match.group(1).strip().lower()
             if "all" in privileges:
@@ -411,9 +430,7 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        match = re.search(r"ON\s+(?:TABLE\s+)?(?:(\w+)\.)?(\w+)", query, re.IGNORECASE)
+        match = _DCL_OBJECT_RE.search(query)
         if match:
             return match.group(2)
 
@@ -424,18 +441,9 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        # Look for common patterns of object names in SQL
-        patterns = [
-            r"(?:CREATE|ALTER|DROP)\s+(?:\w+\s+)+(?:(\w+)\.)?(\w+)",  # General DDL pattern
-            r"ON\s+(?:(\w+)\.)?(\w+)",  # ON clause
-            r"FROM\s+(?:(\w+)\.)?(\w+)",  # FROM clause
-            r"INTO\s+(?:(\w+)\.)?(\w+)",  # INTO clause
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        # Look for common patterns of object names in SQL, in priority order
+        for pattern in _GENERIC_OBJECT_PATTERNS:
+            match = pattern.search(query)
             if match and match.group(2):
                 return match.group(2)
 
@@ -446,13 +454,7 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        match = re.search(
-            r"(?:CREATE|ALTER|DROP|REFRESH)\s+(?:MATERIALIZED\s+VIEW)\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)",
-            query,
-            re.IGNORECASE,
-        )
+        match = _MATERIALIZED_VIEW_RE.search(query)
         if match:
             return match.group(2)
 
@@ -463,13 +465,7 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        match = re.search(
-            r"(?:CREATE|ALTER|DROP)\s+(?:FOREIGN\s+TABLE)\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:(\w+)\.)?(\w+)",
-            query,
-            re.IGNORECASE,
-        )
+        match = _FOREIGN_TABLE_RE.search(query)
         if match:
             return match.group(2)
 
@@ -480,9 +476,7 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
-        match = re.search(r"(?:CREATE|ALTER|DROP)\s+EXTENSION\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", query, re.IGNORECASE)
+        match = _EXTENSION_RE.search(query)
         if match:
             return match.group(1)
 
@@ -493,15 +487,13 @@ class MigrationManager:
         if not query:
             return "unknown"
 
-        import re
-
         # For ENUM types
-        match = re.search(r"(?:CREATE|ALTER|DROP)\s+TYPE\s+(?:(\w+)\.)?(\w+)", query, re.IGNORECASE)
+        match = _TYPE_RE.search(query)
         if match:
             return match.group(2)
 
         # For DOMAIN types
-        match = re.search(r"(?:CREATE|ALTER|DROP)\s+DOMAIN\s+(?:(\w+)\.)?(\w+)", query, re.IGNORECASE)
+        match = _DOMAIN_RE.search(query)
         if match:
             return match.group(2)
 
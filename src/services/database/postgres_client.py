@@ -17,6 +17,11 @@ from src.settings import Settings
 # Define a type variable for generic return types
 T = TypeVar("T")
 
+# Prepared statement cache settings for direct connections. Supabase's transaction pooler hands each
+# transaction a different server connection, so remote pools keep asyncpg's statement cache disabled.
+STATEMENT_CACHE_SIZE = 256
+MAX_CACHED_STATEMENT_LIFETIME = 300  # 5 minutes
+
 # Note: Connection pool handling is managed via the lifespan context manager in server.py
 
 
@@ -74,15 +79,16 @@ class PostgresClient:
         self._pool: asyncpg.Pool[asyncpg.Record] | None = None
         self._settings = settings
         self.project_ref = project_ref or self._settings.supabase_project_ref
+        # Local projects connect directly; remote ones go through Supabase's transaction pooler
+        self.is_local = self.project_ref.startswith("127.0.0.1")
         self.db_password = db_password or self._settings.supabase_db_password
         self.db_region = db_region or self._settings.supabase_region
         self.db_url = self._build_connection_string()
         self.sql_validator: SQLValidator = SQLValidator()
 
         # Only log once during initialization with clear project info
-        is_local = self.project_ref.startswith("127.0.0.1")
         logger.info(
-            f"✔️ PostgreSQL client initialized successfully for {'local' if is_local else 'remote'} "
+            f"✔️ PostgreSQL client initialized successfully for {'local' if self.is_local else 'remote'} "
             f"project: {self.project_ref} (region: {self.db_region})"
         )
 
@@ -122,7 +128,7 @@ class PostgresClient:
         """
         encoded_password = urllib.parse.quote_plus(self.db_password)
 
-        if self.project_ref.startswith("127.0.0.1"):
+        if self.is_local:
             # Local development
             connection_string = f"postgresql://postgres:{encoded_password}@{self.project_ref}/postgres"
             return connection_string
@@ -159,12 +165,22 @@ class PostgresClient:
         try:
             logger.debug(f"Creating connection pool for project: {self.project_ref}")
 
+            # Direct local connections can reuse server-side prepared statements across queries
+            statement_cache_options = (
+                {
+                    "statement_cache_size": STATEMENT_CACHE_SIZE,
+                    "max_cached_statement_lifetime": MAX_CACHED_STATEMENT_LIFETIME,
+                }
+                if self.is_local
+                else {"statement_cache_size": 0}
+            )
+
             # Create the pool with optimal settings
             pool = await asyncpg.create_pool(
                 self.db_url,
                 min_size=2,  # Minimum connections to keep ready
                 max_size=10,  # Maximum connections allowed (same as current)
-                statement_cache_size=0,
+                **statement_cache_options,
                 command_timeout=30.0,  # Command timeout in seconds
                 max_inactive_connection_lifetime=300.0,  # 5 minutes
             )
@@ -329,6 +345,9 @@ class PostgresClient:
             # Return the result
             return StatementResult(rows=rows)
 
+        except asyncpg.exceptions.InvalidCachedStatementError:
+            # Left for execute_query, which resets the statement cache and retries the transaction
+            raise
         except asyncpg.PostgresError as e:
             await self._handle_postgres_error(e)
 
@@ -385,7 +404,14 @@ class PostgresClient:
                 return results
 
             # Execute the operation within a transaction
-            results = await self.with_transaction(conn, transaction_operation, readonly)
+            try:
+                results = await self.with_transaction(conn, transaction_operation, readonly)
+            except asyncpg.exceptions.InvalidCachedStatementError as e:
+                # A schema change invalidated a cached prepared statement. asyncpg can't re-prepare it
+                # inside a transaction, so reset the cache and rerun the rolled-back transaction once.
+                logger.debug(f"Cached statement invalidated, retrying with a fresh statement cache: {e}")
+                await conn.reload_schema_state()
+                results = await self.with_transaction(conn, transaction_operation, readonly)
             return QueryResult(results=results)
 
         # Execute the operation with a connection
@@ -1,19 +1,34 @@
-from pathlib import Path
+import re
+from functools import lru_cache
+from importlib.resources import files
+from importlib.resources.abc import Traversable
 
 from src.logger import logger
 
+# Placeholders in create_migration.sql; re.split keeps the captured names at odd indices
+_CREATE_MIGRATION_PLACEHOLDER_RE = re.compile(r"\{(version|name|statements)\}")
+
 
 class SQLLoader:
     """Responsible for loading SQL queries from files."""
 
     # Path to SQL files directory
-    SQL_DIR = Path(__file__).parent / "queries"
+    SQL_DIR: Traversable = files(__package__) / "queries"
+
+    # Template for get_migrations_query, loaded on first use
+    _migrations_template: str | None = None
+
+    # create_migration.sql split into literal segments and placeholder names, built on first use
+    _create_migration_segments: tuple[str, ...] | None = None
 
     @classmethod
+    @lru_cache(maxsize=64)
     def load_sql(cls, filename: str) -> str:
         """
         Load SQL from a file in the sql directory.
 
+        File contents are cached, so each SQL file is read from disk only once per process.
+
         Args:
             filename: Name of the SQL file (with or without .sql extension)
 
@@ -29,11 +44,11 @@ class SQLLoader:
 
         file_path = cls.SQL_DIR / filename
 
-        if not file_path.exists():
+        if not file_path.is_file():
             logger.error(f"SQL file not found: {file_path}")
             raise FileNotFoundError(f"SQL file not found: {file_path}")
 
-        with open(file_path) as f:
+        with file_path.open() as f:
             sql = f.read().strip()
             logger.debug(f"Loaded SQL file: {filename} ({len(sql)} chars)")
             return sql
@@ -56,16 +71,23 @@ class SQLLoader:
         return query.replace("{schema_name}", schema_name).replace("{table}", table)
 
     @classmethod
+    @lru_cache(maxsize=64)
     def get_migrations_query(
         cls, limit: int = 50, offset: int = 0, name_pattern: str = "", include_full_queries: bool = False
     ) -> str:
-        """Get a query to list migrations."""
-        query = cls.load_sql("get_migrations")
-        return (
-            query.replace("{limit}", str(limit))
-            .replace("{offset}", str(offset))
-            .replace("{name_pattern}", name_pattern)
-            .replace("{include_full_queries}", str(include_full_queries).lower())
+        """Get a query to list migrations.
+
+        Rendered queries are cached per argument combination.
+        """
+        if cls._migrations_template is None:
+            cls._migrations_template = cls.load_sql("get_migrations")
+        return cls._migrations_template.format_map(
+            {
+                "limit": limit,
+                "offset": offset,
+                "name_pattern": name_pattern,
+                "include_full_queries": str(include_full_queries).lower(),
+            }
         )
 
     @classmethod
@@ -85,8 +107,14 @@ class SQLLoader:
         Returns:
             str: The SQL query to create a migration
         """
-        query = cls.load_sql("create_migration")
-        return query.replace("{version}", version).replace("{name}", name).replace("{statements}", statements)
+        if cls._create_migration_segments is None:
+            cls._create_migration_segments = tuple(
+                _CREATE_MIGRATION_PLACEHOLDER_RE.split(cls.load_sql("create_migration"))
+            )
+        values = {"version": version, "name": name, "statements": statements}
+        return "".join(
+            values[segment] if i % 2 else segment for i, segment in enumerate(cls._create_migration_segments)
+        )
 
     @classmethod
     def get_logs_query(cls, collection: str, where_clause: str = "", limit: int = 20) -> str:
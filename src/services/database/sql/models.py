@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.services.safety.models import OperationRiskLevel
 
@@ -65,6 +65,9 @@ class SQLQueryCommand(str, Enum):
 class ValidatedStatement(BaseModel):
     """Result of the query validation for a single SQL statement."""
 
+    # Statements are never changed after validation, so they can be shared and hashed
+    model_config = ConfigDict(frozen=True)
+
     category: SQLQueryCategory = Field(
         ..., description="The category of SQL statement (DQL, DML, DDL, etc.) derived from pglast parse tree"
     )
@@ -1,3 +1,8 @@
+import re
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import lru_cache
+from itertools import accumulate
 from typing import Any
 
 from pglast.parser import ParseError, parse_sql
@@ -12,6 +17,28 @@ from src.services.database.sql.models import (
 )
 from src.services.safety.safety_configs import SQLSafetyConfig
 
+# Compiled once per interpreter; matches a TCL keyword at the start of the query or after any semicolon
+_TCL_RE = re.compile(r"(?i)(?:^|;)\s*(BEGIN|START\s+TRANSACTION|COMMIT|END|ROLLBACK|ABORT|SAVEPOINT|RELEASE)\b")
+
+_IDENT_RE = re.compile(r"\A[A-Za-z_][A-Za-z0-9_]*\Z")
+
+
+def _statement_span(stmt: Any, text_len: int, offset: int = 0) -> tuple[int, int]:
+    """Return the start and end of a parsed statement within its text.
+
+    Args:
+        stmt: A pglast RawStmt
+        text_len: Length of the parsed text, used when the statement runs to the end of it
+        offset: Offset of the parsed text within the text being sliced
+
+    Returns:
+        tuple[int, int]: Start and end indexes of the statement
+    """
+    # pglast reports a missing location as None and a statement running to the end of the text as length 0
+    start = stmt.stmt_location or 0
+    end = start + stmt.stmt_len if stmt.stmt_len else text_len
+    return offset + start, offset + end
+
 
 class SQLValidator:
     """SQL validator class that is based on pglast library.
@@ -50,11 +77,14 @@ class SQLValidator:
         - Cannot be empty
         - Cannot contain spaces or special characters
         """
+        # isidentifier() rejects most invalid names before the regex runs
+        if schema_name.isidentifier() and _IDENT_RE.match(schema_name):
+            return schema_name
         if not schema_name.strip():
             raise ValidationError("Schema name cannot be empty")
         if " " in schema_name:
             raise ValidationError("Schema name cannot contain spaces")
-        return schema_name
+        raise ValidationError("Schema name can only contain letters, digits and underscores")
 
     def validate_table_name(self, table: str) -> str:
         """Validate table name.
@@ -64,11 +94,14 @@ class SQLValidator:
         - Cannot be empty
         - Cannot contain spaces or special characters
         """
+        # isidentifier() rejects most invalid names before the regex runs
+        if table.isidentifier() and _IDENT_RE.match(table):
+            return table
         if not table.strip():
             raise ValidationError("Table name cannot be empty")
         if " " in table:
             raise ValidationError("Table name cannot contain spaces")
-        return table
+        raise ValidationError("Table name can only contain letters, digits and underscores")
 
     def basic_query_validation(self, query: str) -> str:
         """Validate SQL query.
@@ -77,8 +110,8 @@ class SQLValidator:
         - Must be a string
         - Cannot be empty
         """
-        if not query.strip():
-            raise ValidationError("Query cannot be empty")
+        if not query or query.isspace():
+            raise ValidationError("Query cannot be empty", code="EMPTY_QUERY")
         return query
 
     @classmethod
@@ -89,9 +122,27 @@ class SQLValidator:
             query: SQL query string
 
         Returns:
-            bool: True if the query contains any transaction control statements
+            bool: True if any statement in the query is a transaction control statement
+        """
+        return _TCL_RE.search(query) is not None
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse(query: str) -> tuple[Any, ...]:
+        """Parse a stripped SQL query into pglast statements.
+
+        Results are memoized per query text; only the parse tree is cached, so
+        classification and risk aggregation still run on every validation.
+
+        Args:
+            query: SQL query string with surrounding whitespace removed
+
+        Returns:
+            tuple: The parsed RawStmt nodes
+        Raises:
+            ParseError: If the query is not valid SQL
         """
-        return any(x in query.upper() for x in ["BEGIN", "COMMIT", "ROLLBACK"])
+        return parse_sql(query)
 
     def validate_query(self, sql_query: str) -> QueryValidationResults:
         """
@@ -109,28 +160,27 @@ class SQLValidator:
             # Validate raw input
             sql_query = self.basic_query_validation(sql_query)
 
-            # Parse the SQL using PostgreSQL's parser
-            parse_tree = parse_sql(sql_query)
+            # Parse the SQL using PostgreSQL's parser; whitespace variants share a cache entry
+            stripped_query = sql_query.strip()
+            parse_tree = self._parse(stripped_query)
             if parse_tree is None:
                 logger.debug("No statements found in the query")
             # logger.debug(f"Parse tree generated with {parse_tree} statements")
 
             # Validate statements
-            result = self.validate_statements(original_query=sql_query, parse_tree=parse_tree)
+            result = self.validate_statements(
+                original_query=sql_query,
+                parse_tree=parse_tree,
+                location_offset=len(sql_query) - len(sql_query.lstrip()),
+            )
 
             # Check if the query contains transaction control statements and reject them
-            for statement in result.statements:
-                if statement.category == SQLQueryCategory.TCL:
-                    logger.warning(f"Transaction control statement detected: {statement.command}")
-                    raise ValidationError(
-                        "Transaction control statements (BEGIN, COMMIT, ROLLBACK) are not allowed. "
-                        "Queries will be automatically wrapped in transactions by the system."
-                    )
+            self._reject_transaction_control(result)
 
             return result
         except ParseError as e:
             logger.exception(f"SQL syntax error: {str(e)}")
-            raise ValidationError(f"SQL syntax error: {str(e)}") from e
+            raise ValidationError(f"SQL syntax error: {str(e)}", code="SYNTAX_ERROR") from e
         except ValidationError:
             # let it propagate
             raise
@@ -138,6 +188,72 @@ class SQLValidator:
             logger.exception(f"Unexpected error during SQL validation: {str(e)}")
             raise ValidationError(f"Unexpected error during SQL validation: {str(e)}") from e
 
+    def validate_queries(self, queries: Sequence[str]) -> list[QueryValidationResults]:
+        """
+        Validate several SQL queries with a single parser invocation.
+
+        The queries are joined with a statement separator, parsed once, and the
+        resulting statements are assigned back to their source query by location.
+        If the batch fails to parse, each query is validated on its own so the
+        error points at the offending query.
+
+        Args:
+            queries: SQL query strings to validate
+
+        Returns:
+            list[QueryValidationResults]: One validation result per query, in input order
+        Raises:
+            ValidationError: If any query is not valid or contains TCL statements
+        """
+        if not queries:
+            return []
+        for query in queries:
+            self.basic_query_validation(query)
+
+        # The leading newline ends any trailing line comment before the separator
+        separator = "\n;\n"
+        starts = list(accumulate((len(query) + len(separator) for query in queries[:-1]), initial=0))
+
+        try:
+            parse_tree = parse_sql(separator.join(queries))
+        except ParseError:
+            logger.debug("Batch parse failed, validating queries individually")
+            return [self.validate_query(query) for query in queries]
+
+        batch_len = starts[-1] + len(queries[-1])
+        grouped: list[list[Any]] = [[] for _ in queries]
+        for stmt in parse_tree:
+            start, end = _statement_span(stmt, batch_len)
+            index = bisect_right(starts, start) - 1
+            if end > starts[index] + len(queries[index]) + 1:
+                # The statement ran past the separator's semicolon, so the mapping can't be trusted
+                return [self.validate_query(query) for query in queries]
+            grouped[index].append(stmt)
+
+        results = []
+        try:
+            for query, start, statements in zip(queries, starts, grouped, strict=True):
+                result = self.validate_statements(original_query=query, parse_tree=statements, location_offset=-start)
+                self._reject_transaction_control(result)
+                results.append(result)
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.exception(f"Unexpected error during SQL validation: {str(e)}")
+            raise ValidationError(f"Unexpected error during SQL validation: {str(e)}") from e
+        return results
+
+    def _reject_transaction_control(self, result: QueryValidationResults) -> None:
+        """Raise if any validated statement is a transaction control statement."""
+        for statement in result.statements:
+            if statement.category == SQLQueryCategory.TCL:
+                logger.warning(f"Transaction control statement detected: {statement.command}")
+                raise ValidationError(
+                    "Transaction control statements (BEGIN, COMMIT, ROLLBACK) are not allowed. "
+                    "Queries will be automatically wrapped in transactions by the system.",
+                    code="TCL_NOT_ALLOWED",
+                )
+
     def _map_to_command(self, stmt_type: str) -> SQLQueryCommand:
         """Map a pglast statement type to our SQLQueryCommand enum."""
 
@@ -202,11 +318,15 @@ class SQLValidator:
         # Try to map the statement type, default to UNKNOWN
         return mapping.get(stmt_type, SQLQueryCommand.UNKNOWN)
 
-    def validate_statements(self, original_query: str, parse_tree: Any) -> QueryValidationResults:
+    def validate_statements(
+        self, original_query: str, parse_tree: Any, location_offset: int = 0
+    ) -> QueryValidationResults:
         """Validate the statements in the parse tree.
 
         Args:
+            original_query: The query text the statements are sliced from
             parse_tree: The parse tree to validate
+            location_offset: Offset of the parsed text within original_query (leading whitespace)
 
         Returns:
             SQLBatchValidationResult: A validation result object containing information about the SQL statements
@@ -218,6 +338,9 @@ class SQLValidator:
         if parse_tree is None:
             return result
 
+        # A statement reported as running to the end of the parsed text ends at the query's last non-blank character
+        parsed_len = len(original_query.rstrip()) - location_offset
+
         try:
             for stmt in parse_tree:
                 if not hasattr(stmt, "stmt"):
@@ -269,7 +392,7 @@ class SQLValidator:
                     needs_migration=classification["needs_migration"],
                     object_type=object_type,
                     schema_name=schema_name,
-                    query=original_query[stmt.stmt_location : stmt.stmt_location + stmt.stmt_len]
+                    query=original_query[slice(*_statement_span(stmt, parsed_len, location_offset))]
                     if hasattr(stmt, "stmt_location") and hasattr(stmt, "stmt_len")
                     else None,
                 )
@@ -21,10 +21,33 @@ class LogManager:
         "pgbouncer": "pgbouncer_logs",
     }
 
+    # Time filter prefix per collection; only the number of hours is interpolated per query.
+    # The timestamp column is qualified with the table name to avoid ambiguity.
+    _TIMESTAMP_CLAUSE_PREFIXES = {
+        collection: f"{table_name}.timestamp > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL "
+        for collection, table_name in COLLECTION_TO_TABLE.items()
+    }
+
     def __init__(self) -> None:
         """Initialize the LogManager."""
         self.sql_loader = SQLLoader()
 
+    @staticmethod
+    def _sql_escape(value: str) -> str:
+        """Escape single quotes for use inside a SQL string literal."""
+        return value.replace("'", "''")
+
+    @classmethod
+    def _render_filter(cls, filter_obj: dict[str, Any]) -> str:
+        """Render a filter object with field, operator, and value as a SQL condition."""
+        value = filter_obj["value"]
+
+        # Handle string values
+        if isinstance(value, str) and not value.isdigit():
+            value = f"'{cls._sql_escape(value)}'"
+
+        return f"{filter_obj['field']} {filter_obj['operator']} {value}"
+
     def _build_where_clause(
         self,
         collection: str,
@@ -49,44 +72,27 @@ class LogManager:
 
         clauses = []
 
-        # Get the table name for this collection
-        table_name = self.COLLECTION_TO_TABLE.get(collection, collection)
-
         # Add time filter using BigQuery's TIMESTAMP_SUB function
         if hours_ago:
-            # Qualify the timestamp column with the table name to avoid ambiguity
-            clauses.append(f"{table_name}.timestamp > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {hours_ago} HOUR)")
+            prefix = self._TIMESTAMP_CLAUSE_PREFIXES.get(collection)
+            if prefix is None:
+                prefix = f"{collection}.timestamp > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL "
+            clauses.append(f"{prefix}{hours_ago} HOUR)")
 
         # Add search filter
         if search:
             # Escape single quotes in search text
-            search_escaped = search.replace("'", "''")
-            clauses.append(f"event_message LIKE '%{search_escaped}%'")
+            clauses.append(f"event_message LIKE '%{self._sql_escape(search)}%'")
 
         # Add custom filters
         if filters:
-            for filter_obj in filters:
-                field = filter_obj["field"]
-                operator = filter_obj["operator"]
-                value = filter_obj["value"]
-
-                # Handle string values
-                if isinstance(value, str) and not value.isdigit():
-                    value = f"'{value.replace("'", "''")}'"
-
-                clauses.append(f"{field} {operator} {value}")
-
-        # For cron logs, we already have a WHERE clause in the template
-        if collection == "cron":
-            if clauses:
-                where_clause = f"AND {' AND '.join(clauses)}"
-            else:
-                where_clause = ""
-        else:
-            if clauses:
-                where_clause = f"WHERE {' AND '.join(clauses)}"
-            else:
-                where_clause = ""
+            clauses.extend(map(self._render_filter, filters))
+
+        where_clause = ""
+        if clauses:
+            # For cron logs, we already have a WHERE clause in the template
+            prefix = "AND " if collection == "cron" else "WHERE "
+            where_clause = prefix + " AND ".join(clauses)
 
         logger.debug(f"Built WHERE clause: {where_clause}")
         return where_clause
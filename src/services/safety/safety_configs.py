@@ -1,6 +1,7 @@
 import re
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Generic, TypeVar
 
 from src.services.database.sql.models import (
@@ -11,6 +12,9 @@ from src.services.safety.models import OperationRiskLevel, SafetyMode
 
 T = TypeVar("T")
 
+# Placeholder segments in API path patterns, e.g. {ref} or {function_slug}
+_PATH_PLACEHOLDER_RE = re.compile(r"\{([^/{}]+)\}")
+
 
 class SafetyConfigBase(Generic[T], ABC):
     """Abstract base class for all SafetyConfig classes of specific clients.
@@ -21,6 +25,20 @@ class SafetyConfigBase(Generic[T], ABC):
     - check safety level of operation
     """
 
+    __slots__ = ()
+
+    # Risk level policies as bitmasks, one bit per risk level (1 << risk_level)
+    # LOW risk operations are always allowed
+    _ALWAYS_ALLOWED_MASK = 1 << OperationRiskLevel.LOW
+    # MEDIUM and HIGH risk operations are allowed only in UNSAFE mode (HIGH also needs confirmation);
+    # EXTREME risk operations are never allowed
+    _ALLOWED_MASKS: dict[SafetyMode, int] = {
+        SafetyMode.SAFE: _ALWAYS_ALLOWED_MASK,
+        SafetyMode.UNSAFE: _ALWAYS_ALLOWED_MASK | 1 << OperationRiskLevel.MEDIUM | 1 << OperationRiskLevel.HIGH,
+    }
+    # Only HIGH and EXTREME risk operations require confirmation
+    _CONFIRMATION_MASK = 1 << OperationRiskLevel.HIGH | 1 << OperationRiskLevel.EXTREME
+
     @abstractmethod
     def get_risk_level(self, operation: T) -> OperationRiskLevel:
         """Get the risk level for an operation.
@@ -43,20 +61,7 @@ class SafetyConfigBase(Generic[T], ABC):
         Returns:
             True if the operation is allowed, False otherwise
         """
-        # LOW risk operations are always allowed
-        if risk_level == OperationRiskLevel.LOW:
-            return True
-
-        # MEDIUM risk operations are allowed only in UNSAFE mode
-        if risk_level == OperationRiskLevel.MEDIUM:
-            return mode == SafetyMode.UNSAFE
-
-        # HIGH risk operations are allowed only in UNSAFE mode with confirmation
-        if risk_level == OperationRiskLevel.HIGH:
-            return mode == SafetyMode.UNSAFE
-
-        # EXTREME risk operations are never allowed
-        return False
+        return bool(self._ALLOWED_MASKS.get(mode, self._ALWAYS_ALLOWED_MASK) & (1 << risk_level))
 
     def needs_confirmation(self, risk_level: OperationRiskLevel) -> bool:
         """Check if an operation needs confirmation based on its risk level.
@@ -67,8 +72,7 @@ class SafetyConfigBase(Generic[T], ABC):
         Returns:
             True if the operation needs confirmation, False otherwise
         """
-        # Only HIGH and EXTREME risk operations require confirmation
-        return risk_level >= OperationRiskLevel.HIGH
+        return bool(self._CONFIRMATION_MASK & (1 << risk_level))
 
 
 # ========
@@ -88,12 +92,18 @@ class HTTPMethod(str, Enum):
     OPTIONS = "OPTIONS"
 
 
+# Upper- and lower-case method names -> HTTPMethod, so common spellings skip str.upper()
+_METHOD_LOOKUP: dict[str, HTTPMethod] = {m.value: m for m in HTTPMethod} | {m.value.lower(): m for m in HTTPMethod}
+
+
 class APISafetyConfig(SafetyConfigBase[tuple[str, str, dict[str, Any], dict[str, Any], dict[str, Any]]]):
     """Safety configuration for API operations.
 
     The operation type is a tuple of (method, path).
     """
 
+    __slots__ = ("_group_risk_levels", "_method_patterns", "_cached_risk_level")
+
     # Maps risk levels to operations (method + path patterns)
     PATH_SAFETY_CONFIG = {
         OperationRiskLevel.EXTREME: {
@@ -169,6 +179,25 @@ class APISafetyConfig(SafetyConfigBase[tuple[str, str, dict[str, Any], dict[str,
         },
     }
 
+    def __init__(self) -> None:
+        """Compile the path patterns of each HTTP method into a single regex."""
+        # Named group -> risk level, and HTTP method -> alternation of all its patterns ordered from
+        # highest to lowest risk, so the first alternative that fully matches carries the highest risk
+        self._group_risk_levels: dict[str, OperationRiskLevel] = {}
+        alternatives: dict[str, list[str]] = {}
+        for risk_level in sorted(self.PATH_SAFETY_CONFIG.keys(), reverse=True):
+            for method, patterns in self.PATH_SAFETY_CONFIG[risk_level].items():
+                group = f"{method.value}_{risk_level.name}"
+                self._group_risk_levels[group] = risk_level
+                regex = "|".join(self._convert_pattern_to_regex(pattern) for pattern in patterns)
+                alternatives.setdefault(method.value, []).append(f"(?P<{group}>{regex})")
+        self._method_patterns: dict[str, re.Pattern[str]] = {
+            method: re.compile("|".join(groups)) for method, groups in alternatives.items()
+        }
+
+        # API paths repeat heavily, so classification results are cached per instance by (method, path)
+        self._cached_risk_level = lru_cache(maxsize=1024)(self._match_risk_level)
+
     def get_risk_level(
         self, operation: tuple[str, str, dict[str, Any], dict[str, Any], dict[str, Any]]
     ) -> OperationRiskLevel:
@@ -181,49 +210,27 @@ class APISafetyConfig(SafetyConfigBase[tuple[str, str, dict[str, Any], dict[str,
             The risk level for the operation
         """
         method, path, _, _, _ = operation
+        return self._cached_risk_level(_METHOD_LOOKUP.get(method) or method.upper(), path)
 
-        # Check each risk level from highest to lowest
-        for risk_level in sorted(self.PATH_SAFETY_CONFIG.keys(), reverse=True):
-            if self._path_matches_risk_level(method, path, risk_level):
-                return risk_level
+    def _match_risk_level(self, method: str, path: str) -> OperationRiskLevel:
+        """Match an upper-cased method and path against the compiled patterns."""
+        pattern = self._method_patterns.get(method)
+        if pattern is not None:
+            match = pattern.fullmatch(path)
+            if match and match.lastgroup:
+                return self._group_risk_levels[match.lastgroup]
 
         # Default to low risk
         return OperationRiskLevel.LOW
 
-    def _path_matches_risk_level(self, method: str, path: str, risk_level: OperationRiskLevel) -> bool:
-        """Check if the method and path match any pattern for the given risk level."""
-        patterns = self.PATH_SAFETY_CONFIG.get(risk_level, {})
-
-        if method not in patterns:
-            return False
-
-        for pattern in patterns[method]:
-            # Convert placeholder pattern to regex
-            regex_pattern = self._convert_pattern_to_regex(pattern)
-            if re.match(regex_pattern, path):
-                return True
-
-        return False
-
     def _convert_pattern_to_regex(self, pattern: str) -> str:
         """Convert a placeholder pattern to a regex pattern.
 
-        Replaces placeholders like {ref} with regex patterns for matching.
+        Placeholders like {ref} match a single path segment; everything else is matched literally.
         """
-        # Replace common placeholders with regex patterns
-        regex_pattern = pattern
-        regex_pattern = regex_pattern.replace("{ref}", r"[^/]+")
-        regex_pattern = regex_pattern.replace("{id}", r"[^/]+")
-        regex_pattern = regex_pattern.replace("{slug}", r"[^/]+")
-        regex_pattern = regex_pattern.replace("{table}", r"[^/]+")
-        regex_pattern = regex_pattern.replace("{branch_id}", r"[^/]+")
-        regex_pattern = regex_pattern.replace("{function_slug}", r"[^/]+")
-
-        # Add end anchor to ensure full path matching
-        if not regex_pattern.endswith("$"):
-            regex_pattern += "$"
-
-        return regex_pattern
+        parts = _PATH_PLACEHOLDER_RE.split(pattern)
+        # re.split keeps the captured placeholder names at odd indices
+        return "".join(r"[^/]+" if i % 2 else re.escape(part) for i, part in enumerate(parts))
 
 
 # ========
@@ -234,6 +241,8 @@ class APISafetyConfig(SafetyConfigBase[tuple[str, str, dict[str, Any], dict[str,
 class SQLSafetyConfig(SafetyConfigBase[QueryValidationResults]):
     """Safety configuration for SQL operations."""
 
+    __slots__ = ()
+
     STATEMENT_CONFIG = {
         # DQL - all LOW risk, no migrations
         "SelectStmt": {
@@ -1,5 +1,6 @@
+import secrets
 import time
-import uuid
+from collections import OrderedDict
 from typing import Any, Optional
 
 from src.exceptions import ConfirmationRequiredError, OperationNotAllowedError
@@ -17,6 +18,8 @@ class SafetyManager:
       - Check if operations are allowed
     Serves as the central point for safety decisions"""
 
+    __slots__ = ("_safety_modes", "_safety_configs", "_pending_confirmations", "_confirmation_expiry")
+
     _instance: Optional["SafetyManager"] = None
 
     def __init__(self) -> None:
@@ -26,7 +29,7 @@ class SafetyManager:
             ClientType.API: SafetyMode.SAFE,
         }
         self._safety_configs: dict[ClientType, SafetyConfigBase[Any]] = {}
-        self._pending_confirmations: dict[str, dict[str, Any]] = {}
+        self._pending_confirmations: OrderedDict[str, dict[str, Any]] = OrderedDict()
         self._confirmation_expiry = 300  # 5 minutes in seconds
 
     @classmethod
@@ -158,14 +161,14 @@ class SafetyManager:
             A unique confirmation ID
         """
         # Generate a unique ID
-        confirmation_id = f"conf_{uuid.uuid4().hex[:8]}"
+        confirmation_id = f"conf_{secrets.token_hex(4)}"
 
         # Store the operation with metadata
         self._pending_confirmations[confirmation_id] = {
             "operation": operation,
             "client_type": client_type,
             "risk_level": risk_level,
-            "timestamp": time.time(),
+            "timestamp": time.monotonic(),
         }
 
         # Clean up expired confirmations
@@ -189,17 +192,18 @@ class SafetyManager:
         return self._pending_confirmations.get(confirmation_id)
 
     def _cleanup_expired_confirmations(self) -> None:
-        """Remove expired confirmations from storage."""
-        current_time = time.time()
-        expired_ids = [
-            conf_id
-            for conf_id, data in self._pending_confirmations.items()
-            if current_time - data["timestamp"] > self._confirmation_expiry
-        ]
-
-        for conf_id in expired_ids:
+        """Remove expired confirmations from storage.
+
+        Confirmations are stored in insertion order with increasing timestamps, so
+        expired entries are always at the front and eviction stops at the first live one.
+        """
+        current_time = time.monotonic()
+        while self._pending_confirmations:
+            conf_id, data = next(iter(self._pending_confirmations.items()))
+            if current_time - data["timestamp"] <= self._confirmation_expiry:
+                break
             logger.debug(f"Removing expired confirmation with ID {conf_id}")
-            del self._pending_confirmations[conf_id]
+            self._pending_confirmations.popitem(last=False)
 
     def get_stored_operation(self, confirmation_id: str) -> Any | None:
         """Get a stored operation by its confirmation ID.
@@ -3,8 +3,6 @@ from __future__ import annotations
 from enum import Enum
 from pathlib import Path
 
-import yaml
-
 from src.logger import logger
 
 
@@ -43,10 +41,18 @@ class ToolManager:
 
     _instance: ToolManager | None = None  # Singleton instance
 
-    def __init__(self) -> None:
-        """Initialize the tool manager."""
+    # Parsed descriptions shared across instances, keyed by the YAML files and their modification times
+    _descriptions_cache: dict[tuple[str, tuple[tuple[str, int], ...]], dict[str, str]] = {}
+
+    def __init__(self, load: bool = True) -> None:
+        """Initialize the tool manager.
+
+        Args:
+            load: Whether to load the tool descriptions from the YAML files. Pass False to start with no descriptions.
+        """
         self.descriptions: dict[str, str] = {}
-        self._load_descriptions()
+        if load:
+            self._load_descriptions()
 
     @classmethod
     def get_instance(cls) -> ToolManager:
@@ -71,16 +77,35 @@ class ToolManager:
         if not descriptions_dir.exists():
             raise FileNotFoundError(f"Tool descriptions directory not found: {descriptions_dir}")
 
+        # Reuse the parsed descriptions if no YAML file was added, removed or modified since the last load
+        yaml_files = list(descriptions_dir.glob("*.yaml"))
+        cache_key = (str(descriptions_dir), tuple((str(f), f.stat().st_mtime_ns) for f in yaml_files))
+        cached_descriptions = self._descriptions_cache.get(cache_key)
+        if cached_descriptions is not None:
+            self.descriptions.update(cached_descriptions)
+            return
+
+        # Imported here so that only an actual (uncached) load pays for PyYAML
+        import yaml
+
+        try:
+            # libyaml-backed loader, much faster than the pure-Python one
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader
+
         # Load all YAML files in the directory
-        for yaml_file in descriptions_dir.glob("*.yaml"):
+        for yaml_file in yaml_files:
             try:
                 with open(yaml_file) as f:
-                    tool_descriptions = yaml.safe_load(f)
+                    tool_descriptions = yaml.load(f, Loader=SafeLoader)
                     if tool_descriptions:
                         self.descriptions.update(tool_descriptions)
             except Exception as e:
                 print(f"Error loading tool descriptions from {yaml_file}: {e}")
 
+        self._descriptions_cache[cache_key] = dict(self.descriptions)
+
     def get_description(self, tool_name: str) -> str:
         """Get the description for a specific tool.
 
@@ -73,7 +73,7 @@ def settings_integration() -> Settings:
     return Settings.with_config(find_config_file(".env.test"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_validator() -> SQLValidator:
     """Fixture providing a mock SQLValidator for integration tests."""
     return SQLValidator()
@@ -190,7 +190,10 @@ def query_manager_integration(
 
 @pytest.fixture(scope="module")
 def mock_api_manager() -> SupabaseApiManager:
-    """Fixture providing a properly mocked API manager for unit tests."""
+    """Fixture providing a properly mocked API manager for unit tests.
+
+    Shared across a test module; tests should override attributes via monkeypatch so changes are undone.
+    """
     # Create mock dependencies
     mock_client = MagicMock()
     mock_safety_manager = MagicMock()
@@ -256,24 +259,27 @@ async def api_manager_integration(
 # ======================
 
 
-@pytest.fixture
-def mock_mcp_server() -> Any:
-    """Fixture providing a mock MCP server for integration tests."""
+class MockMCP:
+    """A simple mock MCP server that mimics the FastMCP interface."""
 
-    # Create a simple mock MCP server that mimics the FastMCP interface
-    class MockMCP:
-        def __init__(self) -> None:
-            self.tools: dict[str, Any] = {}
-            self.name = "mock_mcp"
+    __slots__ = ("tools", "name")
 
-        def register_tool(self, name: str, func: Any, **kwargs: Any) -> None:
-            """Register a tool with the MCP server."""
-            self.tools[name] = func
+    def __init__(self) -> None:
+        self.tools: dict[str, Any] = {}
+        self.name = "mock_mcp"
 
-        def run(self) -> None:
-            """Mock run method."""
-            pass
+    def register_tool(self, name: str, func: Any, **kwargs: Any) -> None:
+        """Register a tool with the MCP server."""
+        self.tools[name] = func
 
+    def run(self) -> None:
+        """Mock run method."""
+        pass
+
+
+@pytest.fixture
+def mock_mcp_server() -> Any:
+    """Fixture providing a mock MCP server for integration tests."""
     return MockMCP()
 
 
@@ -355,9 +361,9 @@ def tools_registry_integration(
     return container
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sql_loader() -> SQLLoader:
-    """Fixture providing a SQLLoader instance for tests."""
+    """Fixture providing a SQLLoader instance for tests; the loader holds no per-instance state."""
     return SQLLoader()
 
 
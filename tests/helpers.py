@@ -0,0 +1,80 @@
+"""Plain helpers shared by test modules; fixtures and hooks live in conftest.py."""
+
+from collections.abc import Awaitable, Callable
+from functools import cache
+from typing import Any
+
+from supabase_mcp.services.database.sql.models import (
+    QueryValidationResults,
+    SQLQueryCategory,
+    SQLQueryCommand,
+    ValidatedStatement,
+)
+from supabase_mcp.services.safety.models import OperationRiskLevel
+
+# ======================
+# Mock Helpers
+# ======================
+
+
+def make_async_return(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Build a coroutine function that ignores its arguments and returns the given value."""
+
+    async def _async_return(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return _async_return
+
+
+def make_async_raise(exc: BaseException) -> Callable[..., Awaitable[Any]]:
+    """Build a coroutine function that ignores its arguments and raises the given exception."""
+
+    async def _async_raise(*args: Any, **kwargs: Any) -> Any:
+        raise exc
+
+    return _async_raise
+
+
+# ======================
+# Validation Result Builders
+# ======================
+
+
+@cache
+def make_statement(
+    query: str,
+    command: SQLQueryCommand,
+    category: SQLQueryCategory,
+    risk_level: OperationRiskLevel,
+    needs_migration: bool = False,
+    object_type: str | None = None,
+    schema_name: str | None = None,
+) -> ValidatedStatement:
+    """Build a ValidatedStatement, sharing one frozen instance per distinct set of arguments.
+
+    The arguments are already typed, so pydantic validation is skipped via model_construct.
+    """
+    return ValidatedStatement.model_construct(
+        query=query,
+        command=command,
+        category=category,
+        risk_level=risk_level,
+        needs_migration=needs_migration,
+        object_type=object_type,
+        schema_name=schema_name,
+    )
+
+
+def make_validation_result(
+    *statements: ValidatedStatement, original_query: str | None = None
+) -> QueryValidationResults:
+    """Wrap statements in a QueryValidationResults whose risk level is the highest among them.
+
+    The original query defaults to the statements' queries joined with spaces.
+    """
+    return QueryValidationResults.model_construct(
+        statements=list(statements),
+        original_query=original_query if original_query is not None else " ".join(s.query or "" for s in statements),
+        highest_risk_level=max(s.risk_level for s in statements),
+        has_transaction_control=False,
+    )
@@ -6,6 +6,13 @@ import pytest
 from supabase_mcp.exceptions import SafetyError
 from supabase_mcp.services.api.api_manager import SupabaseApiManager
 from supabase_mcp.services.safety.models import ClientType
+from tests.helpers import make_async_raise, make_async_return
+
+
+@pytest.fixture(autouse=True)
+def reset_safety_manager(mock_api_manager: SupabaseApiManager) -> None:
+    """Start every test from a clean safety manager mock, since mock_api_manager is module-scoped."""
+    mock_api_manager.safety_manager.reset_mock(return_value=True, side_effect=True)
 
 
 class TestApiManager:
@@ -21,6 +28,7 @@ class TestApiManager:
         """
         # Use the mock_api_manager fixture instead of creating one manually
         api_manager = mock_api_manager
+        assert not api_manager.safety_manager.mock_calls
 
         # Test with a simple path and required parameters (avoiding 'ref' which is auto-injected)
         path = "/v1/organizations/{slug}/members"
@@ -55,7 +63,9 @@ class TestApiManager:
     @pytest.mark.asyncio
     @pytest.mark.unit
     @patch("supabase_mcp.services.api.api_manager.logger")
-    async def test_safety_validation(self, mock_logger: MagicMock, mock_api_manager: SupabaseApiManager):
+    async def test_safety_validation(
+        self, mock_logger: MagicMock, mock_api_manager: SupabaseApiManager, monkeypatch: pytest.MonkeyPatch
+    ):
         """
         Test that API operations are properly validated through the safety manager.
 
@@ -64,20 +74,13 @@ class TestApiManager:
         """
         # Use the mock_api_manager fixture instead of creating one manually
         api_manager = mock_api_manager
+        assert not api_manager.safety_manager.mock_calls
 
         # Mock the replace_path_params method to return the path unchanged
-        api_manager.replace_path_params = MagicMock(return_value="/v1/organizations/example-org")
+        monkeypatch.setattr(api_manager, "replace_path_params", MagicMock(return_value="/v1/organizations/example-org"))
 
         # Mock the client's execute_request method to return a simple response
-        mock_response = {"success": True}
-        api_manager.client.execute_request = MagicMock()
-        api_manager.client.execute_request.return_value = mock_response
-
-        # Make the mock awaitable
-        async def mock_execute_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
-            return mock_response
-
-        api_manager.client.execute_request = mock_execute_request
+        monkeypatch.setattr(api_manager.client, "execute_request", make_async_return({"success": True}))
 
         # Test a successful operation
         method = "GET"
@@ -101,7 +104,7 @@ class TestApiManager:
         def raise_safety_error(*args: Any, **kwargs: Any) -> None:
             raise SafetyError("Operation not allowed")
 
-        api_manager.safety_manager.validate_operation.side_effect = raise_safety_error
+        monkeypatch.setattr(api_manager.safety_manager.validate_operation, "side_effect", raise_safety_error)
 
         # The execute_request method should raise the SafetyError
         with pytest.raises(SafetyError) as excinfo:
@@ -111,23 +114,25 @@ class TestApiManager:
 
     @pytest.mark.asyncio
     @pytest.mark.unit
-    async def test_retrieve_logs_basic(self, mock_api_manager: SupabaseApiManager):
+    async def test_retrieve_logs_basic(self, mock_api_manager: SupabaseApiManager, monkeypatch: pytest.MonkeyPatch):
         """
         Test that the retrieve_logs method correctly builds and executes a logs query.
 
         This test verifies that the API Manager correctly builds a logs query using
         the LogManager and executes it through the Management API.
         """
+        assert not mock_api_manager.safety_manager.mock_calls
+
         # Mock the log_manager's build_logs_query method
-        mock_api_manager.log_manager.build_logs_query = MagicMock(return_value="SELECT * FROM postgres_logs LIMIT 10")
+        monkeypatch.setattr(
+            mock_api_manager.log_manager,
+            "build_logs_query",
+            MagicMock(return_value="SELECT * FROM postgres_logs LIMIT 10"),
+        )
 
         # Mock the execute_request method to return a simple response
         mock_response = {"result": [{"id": "123", "event_message": "test"}]}
-
-        async def mock_execute_request(*args: Any, **kwargs: Any) -> dict[str, Any]:
-            return mock_response
-
-        mock_api_manager.execute_request = mock_execute_request
+        monkeypatch.setattr(mock_api_manager, "execute_request", make_async_return(mock_response))
 
         # Execute the method
         result = await mock_api_manager.retrieve_logs(
@@ -151,21 +156,26 @@ class TestApiManager:
 
     @pytest.mark.asyncio
     @pytest.mark.unit
-    async def test_retrieve_logs_error_handling(self, mock_api_manager: SupabaseApiManager):
+    async def test_retrieve_logs_error_handling(
+        self, mock_api_manager: SupabaseApiManager, monkeypatch: pytest.MonkeyPatch
+    ):
         """
         Test that the retrieve_logs method correctly handles errors.
 
         This test verifies that the API Manager correctly handles errors that occur
         during log retrieval and propagates them to the caller.
         """
+        assert not mock_api_manager.safety_manager.mock_calls
+
         # Mock the log_manager's build_logs_query method
-        mock_api_manager.log_manager.build_logs_query = MagicMock(return_value="SELECT * FROM postgres_logs LIMIT 10")
+        monkeypatch.setattr(
+            mock_api_manager.log_manager,
+            "build_logs_query",
+            MagicMock(return_value="SELECT * FROM postgres_logs LIMIT 10"),
+        )
 
         # Mock the execute_request method to raise an exception
-        async def mock_execute_request_error(*args: Any, **kwargs: Any) -> dict[str, Any]:
-            raise Exception("API error")
-
-        mock_api_manager.execute_request = mock_execute_request_error
+        monkeypatch.setattr(mock_api_manager, "execute_request", make_async_raise(Exception("API error")))
 
         # The retrieve_logs method should propagate the exception
         with pytest.raises(Exception) as excinfo:
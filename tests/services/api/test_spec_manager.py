@@ -1,14 +1,32 @@
 import json
+import logging
+from collections.abc import Generator
 from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 import httpx
 import pytest
+import respx
 
-from supabase_mcp.services.api.spec_manager import ApiSpecManager
+from supabase_mcp.services.api.spec_manager import SPEC_URL, ApiSpecManager
+
+log = logging.getLogger(__name__)
 
 # Test data
 SAMPLE_SPEC = {"openapi": "3.0.0", "paths": {"/v1/test": {"get": {"operationId": "test"}}}}
 
+# Router for the remote spec endpoint, built once and only activated by the spec_route fixture
+SPEC_ROUTER = respx.mock(assert_all_called=False)
+SPEC_ROUTER.get(SPEC_URL, name="spec")
+
+
+@pytest.fixture
+def spec_route() -> Generator[respx.Route, None, None]:
+    """Activate the shared spec router and yield the remote spec route with its call history cleared."""
+    with SPEC_ROUTER:
+        route = SPEC_ROUTER.routes["spec"]
+        route.reset()
+        yield route
+
 
 class TestApiSpecManager:
     """Integration tests for api spec manager tools."""
@@ -37,46 +55,33 @@ class TestApiSpecManager:
             spec_manager_integration._load_local_spec()
 
     # Remote Spec Tests
-    @pytest.mark.asyncio
-    async def test_fetch_remote_spec_success(self, spec_manager_integration: ApiSpecManager):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_remote_spec_success(self, spec_manager_integration: ApiSpecManager, spec_route: respx.Route):
         """Test successful remote spec fetch"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_SPEC
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client  # Mock async context manager
+        spec_route.mock(return_value=httpx.Response(200, json=SAMPLE_SPEC))
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            result = await spec_manager_integration._fetch_remote_spec()
+        result = await spec_manager_integration._fetch_remote_spec()
 
         assert result == SAMPLE_SPEC
-        mock_client.get.assert_called_once()
+        assert spec_route.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_fetch_remote_spec_api_error(self, spec_manager_integration: ApiSpecManager):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_remote_spec_api_error(self, spec_manager_integration: ApiSpecManager, spec_route: respx.Route):
         """Test handling of API error during remote fetch"""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
+        spec_route.mock(return_value=httpx.Response(500))
 
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client  # Mock async context manager
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            result = await spec_manager_integration._fetch_remote_spec()
+        result = await spec_manager_integration._fetch_remote_spec()
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_fetch_remote_spec_network_error(self, spec_manager_integration: ApiSpecManager):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_fetch_remote_spec_network_error(
+        self, spec_manager_integration: ApiSpecManager, spec_route: respx.Route
+    ):
         """Test handling of network error during remote fetch"""
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.NetworkError("Network error")
+        spec_route.mock(side_effect=httpx.NetworkError("Network error"))
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            result = await spec_manager_integration._fetch_remote_spec()
+        result = await spec_manager_integration._fetch_remote_spec()
 
         assert result is None
 
@@ -166,6 +171,39 @@ class TestApiSpecManager:
         assert result == SAMPLE_SPEC
         mock_fetch.assert_called_once()
 
+    def test_get_paths_and_methods_by_domain(self):
+        """Test that domain lookups are served from the caches built over the spec"""
+        spec_manager = ApiSpecManager()
+        spec_manager.spec = {
+            "paths": {
+                "/v1/projects/{ref}/functions": {
+                    "get": {"operationId": "v1-list-all-functions", "tags": ["Edge Functions"]},
+                    "post": {"operationId": "v1-create-a-function", "tags": ["Edge Functions"]},
+                },
+                "/v1/projects/{ref}/config/auth": {"get": {"operationId": "v1-get-auth-config", "tags": ["Auth"]}},
+            }
+        }
+
+        assert spec_manager.get_paths_and_methods_by_domain("Edge Functions") == {
+            "/v1/projects/{ref}/functions": {"get": "v1-list-all-functions", "post": "v1-create-a-function"}
+        }
+        assert spec_manager.get_paths_and_methods_by_domain("Auth") == {
+            "/v1/projects/{ref}/config/auth": {"get": "v1-get-auth-config"}
+        }
+        assert spec_manager.get_paths_and_methods_by_domain("Storage") == {}
+        assert spec_manager.get_all_domains() == ["Auth", "Edge Functions"]
+
+        # Mutating the result must not leak into the cache
+        auth_paths = spec_manager.get_paths_and_methods_by_domain("Auth")
+        auth_paths["/v1/projects/{ref}/config/auth"]["patch"] = "v1-update-auth-config"
+        auth_paths.clear()
+        assert spec_manager.get_paths_and_methods_by_domain("Auth") == {
+            "/v1/projects/{ref}/config/auth": {"get": "v1-get-auth-config"}
+        }
+
+        with pytest.raises(ValueError, match="Invalid domain"):
+            spec_manager.get_paths_and_methods_by_domain("Unknown")
+
     @pytest.mark.asyncio
     async def test_comprehensive_spec_retrieval(self, spec_manager_integration: ApiSpecManager):
         """
@@ -177,8 +215,8 @@ class TestApiSpecManager:
 
         spec_manager = ApiSpecManager()
 
-        # Print the path being used (for debugging)
-        print(f"\nTest is looking for spec at: {LOCAL_SPEC_PATH}")
+        # Log the path being used (for debugging)
+        log.debug("Test is looking for spec at: %s", LOCAL_SPEC_PATH)
 
         # Load the spec
         spec = await spec_manager.get_spec()
@@ -186,7 +224,7 @@ class TestApiSpecManager:
 
         # 1. Test get_all_domains
         all_domains = spec_manager.get_all_domains()
-        print(f"\nAll domains: {all_domains}")
+        log.debug("All domains: %s", all_domains)
         assert len(all_domains) > 0, "Should have at least one domain"
 
         # Verify all expected domains are present
@@ -213,13 +251,11 @@ class TestApiSpecManager:
 
         # Sample a few paths to verify
         sample_paths = list(all_paths.keys())[:5]
-        print("\nSample paths:")
+        log.debug("Sample paths: %s", sample_paths)
         for path in sample_paths:
-            print(f"  {path}:")
             assert path.startswith("/v1/"), f"Path {path} should start with /v1/"
             assert len(all_paths[path]) > 0, f"Path {path} should have at least one method"
             for method, operation_id in all_paths[path].items():
-                print(f"    {method}: {operation_id}")
                 assert method.lower() in ["get", "post", "put", "patch", "delete"], f"Method {method} should be valid"
                 assert operation_id.startswith("v1-"), f"Operation ID {operation_id} should start with v1-"
 
@@ -227,15 +263,13 @@ class TestApiSpecManager:
         for domain in expected_domains:
             domain_paths = spec_manager.get_paths_and_methods_by_domain(domain)
             assert len(domain_paths) > 0, f"Domain {domain} should have at least one path"
-            print(f"\n{domain} domain has {len(domain_paths)} paths")
+            log.debug("%s domain has %d paths", domain, len(domain_paths))
 
         # 4. Test Edge Functions domain specifically
         edge_paths = spec_manager.get_paths_and_methods_by_domain("Edge Functions")
-        print("\nEdge Functions Paths and Methods:")
-        for path in edge_paths:
-            print(f"  {path}")
-            for method, operation_id in edge_paths[path].items():
-                print(f"    {method}: {operation_id}")
+        if log.isEnabledFor(logging.DEBUG):
+            for path, methods in edge_paths.items():
+                log.debug("Edge Functions path %s: %s", path, methods)
 
         # Verify specific Edge Functions paths exist
         expected_edge_paths = [
@@ -269,10 +303,7 @@ class TestApiSpecManager:
         assert "properties" in schema, "Schema should have properties"
 
         # 7. Test caching behavior
-        # Call get_spec again - should use cached version
-        import time
-
-        start_time = time.time()
-        await spec_manager.get_spec()
-        end_time = time.time()
-        assert (end_time - start_time) < 0.1, "Cached spec retrieval should be fast"
+        # Call get_spec again - should return the cached spec without fetching it again
+        with patch.object(spec_manager, "_fetch_remote_spec", AsyncMock()) as mock_fetch:
+            assert await spec_manager.get_spec() is spec, "Cached spec should be returned"
+        mock_fetch.assert_not_called()
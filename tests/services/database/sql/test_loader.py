@@ -1,4 +1,4 @@
-import os
+from importlib.resources import files
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
@@ -11,29 +11,22 @@ from supabase_mcp.services.database.sql.loader import SQLLoader
 class TestSQLLoader:
     """Unit tests for the SQLLoader class."""
 
-    def test_load_sql_with_extension(self):
-        """Test loading SQL with file extension provided."""
+    @pytest.mark.parametrize("filename", ["test.sql", "test"])
+    def test_load_sql(self, filename: str):
+        """Test loading SQL with and without the file extension provided."""
         mock_sql = "SELECT * FROM test;"
 
-        with patch("builtins.open", mock_open(read_data=mock_sql)):
-            with patch.object(Path, "exists", return_value=True):
-                result = SQLLoader.load_sql("test.sql")
-
-        assert result == mock_sql
-
-    def test_load_sql_without_extension(self):
-        """Test loading SQL without file extension provided."""
-        mock_sql = "SELECT * FROM test;"
-
-        with patch("builtins.open", mock_open(read_data=mock_sql)):
-            with patch.object(Path, "exists", return_value=True):
-                result = SQLLoader.load_sql("test")
+        with (
+            patch.object(Path, "open", mock_open(read_data=mock_sql)),
+            patch.object(Path, "is_file", return_value=True),
+        ):
+            result = SQLLoader.load_sql(filename)
 
         assert result == mock_sql
 
     def test_load_sql_file_not_found(self):
         """Test loading SQL when file doesn't exist."""
-        with patch.object(Path, "exists", return_value=False):
+        with patch.object(Path, "is_file", return_value=False):
             with pytest.raises(FileNotFoundError):
                 SQLLoader.load_sql("nonexistent")
 
@@ -66,13 +59,13 @@ class TestSQLLoader:
 
         assert result == expected
 
-    def test_get_migrations_query(self):
+    def test_get_migrations_query(self, monkeypatch: pytest.MonkeyPatch):
         """Test getting migrations query with all parameters."""
         mock_sql = "SELECT * FROM migrations WHERE name LIKE '%{name_pattern}%' LIMIT {limit} OFFSET {offset} AND include_queries = {include_full_queries};"
         expected = "SELECT * FROM migrations WHERE name LIKE '%test%' LIMIT 10 OFFSET 5 AND include_queries = true;"
 
-        with patch.object(SQLLoader, "load_sql", return_value=mock_sql):
-            result = SQLLoader.get_migrations_query(limit=10, offset=5, name_pattern="test", include_full_queries=True)
+        monkeypatch.setattr(SQLLoader, "_migrations_template", mock_sql)
+        result = SQLLoader.get_migrations_query(limit=10, offset=5, name_pattern="test", include_full_queries=True)
 
         assert result == expected
 
@@ -99,5 +92,5 @@ class TestSQLLoader:
 
     def test_sql_dir_path(self):
         """Test that SQL_DIR points to the correct location."""
-        expected_path = Path(SQLLoader.__module__.replace(".", os.sep)).parent / "queries"
-        assert str(SQLLoader.SQL_DIR).endswith(str(expected_path))
+        expected_path = files("supabase_mcp.services.database.sql") / "queries"
+        assert SQLLoader.SQL_DIR == expected_path
@@ -1,98 +1,350 @@
+import datetime
+import itertools
 import re
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 
 import pytest
+from pglast import ast, parse_sql
 
 from supabase_mcp.services.database.migration_manager import MigrationManager
+from supabase_mcp.services.database.sql.models import QueryValidationResults
 from supabase_mcp.services.database.sql.validator import SQLValidator
 
-
-@pytest.fixture
-def sample_ddl_queries() -> dict[str, str]:
+MIGRATION_NAME_RE = re.compile(r"migration_\w+")
+TIMESTAMP14_RE = re.compile(r"^\d{14}$")
+INIT_MIGRATIONS_RE = re.compile(r"CREATE SCHEMA IF NOT EXISTS.*CREATE TABLE IF NOT EXISTS", re.DOTALL)
+
+
+TABLE_STATEMENTS = (
+    "CREATE TABLE users (id SERIAL PRIMARY KEY);",
+    "CREATE TABLE IF NOT EXISTS users (id SERIAL PRIMARY KEY);",
+    "CREATE TABLE public.users (id SERIAL PRIMARY KEY);",
+    "ALTER TABLE users ADD COLUMN email TEXT;",
+    "ALTER TABLE public.users ADD COLUMN email TEXT;",
+    "DROP TABLE users;",
+    "DROP TABLE IF EXISTS users;",
+    "DROP TABLE public.users;",
+    "INSERT INTO users (name) VALUES ('John');",
+    "UPDATE users SET name = 'John' WHERE id = 1;",
+    "DELETE FROM users WHERE id = 1;",
+)
+
+
+EXTRACT_CASES = [
+    # Non-table statements (table statements are checked against the parse tree via TABLE_STATEMENTS)
+    ("_extract_table_name", "", "unknown"),
+    ("_extract_table_name", "SELECT * FROM users;", "unknown"),  # Not handled by this method
+    # CREATE / ALTER / DROP FUNCTION
+    (
+        "_extract_function_name",
+        "CREATE FUNCTION get_user() RETURNS SETOF users AS $$ SELECT * FROM users; $$ LANGUAGE SQL;",
+        "get_user",
+    ),
+    (
+        "_extract_function_name",
+        "CREATE OR REPLACE FUNCTION get_user() RETURNS SETOF users AS $$ SELECT * FROM users; $$ LANGUAGE SQL;",
+        "get_user",
+    ),
+    (
+        "_extract_function_name",
+        "CREATE FUNCTION public.get_user() RETURNS SETOF users AS $$ SELECT * FROM users; $$ LANGUAGE SQL;",
+        "get_user",
+    ),
+    ("_extract_function_name", "ALTER FUNCTION get_user() SECURITY DEFINER;", "get_user"),
+    ("_extract_function_name", "ALTER FUNCTION public.get_user() SECURITY DEFINER;", "get_user"),
+    ("_extract_function_name", "DROP FUNCTION get_user();", "get_user"),
+    ("_extract_function_name", "DROP FUNCTION public.get_user();", "get_user"),
+    ("_extract_function_name", "", "unknown"),
+    ("_extract_function_name", "SELECT * FROM users;", "unknown"),
+    # CREATE / ALTER / DROP VIEW
+    ("_extract_view_name", "CREATE VIEW user_view AS SELECT * FROM users;", "user_view"),
+    ("_extract_view_name", "CREATE OR REPLACE VIEW user_view AS SELECT * FROM users;", "user_view"),
+    ("_extract_view_name", "CREATE VIEW public.user_view AS SELECT * FROM users;", "user_view"),
+    ("_extract_view_name", "ALTER VIEW user_view RENAME TO users_view;", "user_view"),
+    ("_extract_view_name", "ALTER VIEW public.user_view RENAME TO users_view;", "user_view"),
+    ("_extract_view_name", "DROP VIEW user_view;", "user_view"),
+    ("_extract_view_name", "DROP VIEW public.user_view;", "user_view"),
+    ("_extract_view_name", "", "unknown"),
+    ("_extract_view_name", "SELECT * FROM users;", "unknown"),
+    # CREATE / DROP INDEX (the implementation doesn't handle DROP INDEX IF EXISTS)
+    ("_extract_index_name", "CREATE INDEX idx_user_email ON users (email);", "idx_user_email"),
+    ("_extract_index_name", "CREATE INDEX IF NOT EXISTS idx_user_email ON users (email);", "idx_user_email"),
+    ("_extract_index_name", "CREATE INDEX public.idx_user_email ON users (email);", "idx_user_email"),
+    ("_extract_index_name", "DROP INDEX idx_user_email;", "idx_user_email"),
+    ("_extract_index_name", "", "unknown"),
+    ("_extract_index_name", "SELECT * FROM users;", "unknown"),
+    # CREATE / ALTER / DROP EXTENSION (the implementation doesn't handle DROP EXTENSION IF EXISTS)
+    ("_extract_extension_name", "CREATE EXTENSION pgcrypto;", "pgcrypto"),
+    ("_extract_extension_name", "CREATE EXTENSION IF NOT EXISTS pgcrypto;", "pgcrypto"),
+    ("_extract_extension_name", "ALTER EXTENSION pgcrypto UPDATE TO '1.3';", "pgcrypto"),
+    ("_extract_extension_name", "DROP EXTENSION pgcrypto;", "pgcrypto"),
+    ("_extract_extension_name", "", "unknown"),
+    ("_extract_extension_name", "SELECT * FROM users;", "unknown"),
+    # CREATE / ALTER / DROP TYPE and DOMAIN
+    (
+        "_extract_type_name",
+        "CREATE TYPE user_status AS ENUM ('active', 'inactive', 'suspended');",
+        "user_status",
+    ),
+    (
+        "_extract_type_name",
+        "CREATE TYPE public.user_status AS ENUM ('active', 'inactive', 'suspended');",
+        "user_status",
+    ),
+    (
+        "_extract_type_name",
+        "CREATE DOMAIN email_address AS TEXT CHECK (VALUE ~ '^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$');",
+        "email_address",
+    ),
+    (
+        "_extract_type_name",
+        "CREATE DOMAIN public.email_address AS TEXT CHECK (VALUE ~ '^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$');",
+        "email_address",
+    ),
+    ("_extract_type_name", "ALTER TYPE user_status ADD VALUE 'pending';", "user_status"),
+    ("_extract_type_name", "ALTER TYPE public.user_status ADD VALUE 'pending';", "user_status"),
+    ("_extract_type_name", "DROP TYPE user_status;", "user_status"),
+    ("_extract_type_name", "DROP TYPE public.user_status;", "user_status"),
+    ("_extract_type_name", "", "unknown"),
+    ("_extract_type_name", "SELECT * FROM users;", "unknown"),
+    # GRANT / REVOKE objects
+    ("_extract_dcl_object_name", "GRANT SELECT ON users TO anon;", "users"),
+    ("_extract_dcl_object_name", "GRANT SELECT ON TABLE users TO anon;", "users"),
+    ("_extract_dcl_object_name", "GRANT SELECT ON public.users TO anon;", "users"),
+    ("_extract_dcl_object_name", "GRANT SELECT ON TABLE public.users TO anon;", "users"),
+    ("_extract_dcl_object_name", "REVOKE SELECT ON users FROM anon;", "users"),
+    ("_extract_dcl_object_name", "REVOKE SELECT ON TABLE users FROM anon;", "users"),
+    ("_extract_dcl_object_name", "", "unknown"),
+    ("_extract_dcl_object_name", "SELECT * FROM users;", "unknown"),
+    # Generic DDL, FROM and INTO patterns
+    ("_extract_generic_object_name", "CREATE SCHEMA app;", "app"),
+    ("_extract_generic_object_name", "ALTER SCHEMA app RENAME TO application;", "application"),
+    ("_extract_generic_object_name", "DROP SCHEMA app;", "app"),
+    ("_extract_generic_object_name", "SELECT * FROM users;", "users"),
+    ("_extract_generic_object_name", "INSERT INTO users (name) VALUES ('John');", "users"),
+    ("_extract_generic_object_name", "", "unknown"),
+    ("_extract_generic_object_name", "BEGIN;", "unknown"),
+    # UPDATE column lists (the current pattern never matches, so the helper returns "")
+    ("_extract_update_columns", "UPDATE users SET name = 'John' WHERE id = 1;", ""),
+    (
+        "_extract_update_columns",
+        "UPDATE users SET name = 'John', email = 'john@example.com', active = true WHERE id = 1;",
+        "",
+    ),
+    (
+        "_extract_update_columns",
+        "UPDATE users SET name = 'John', email = 'john@example.com', active = true, created_at = NOW(), updated_at = NOW() WHERE id = 1;",
+        "",
+    ),
+    ("_extract_update_columns", "", ""),
+    ("_extract_update_columns", "SELECT * FROM users;", ""),
+    ("_extract_update_columns", "UPDATE users SET name = 'John'", ""),
+    # GRANT / REVOKE privileges (only the first privilege is used)
+    ("_extract_privilege", "GRANT SELECT ON users TO anon;", "select"),
+    ("_extract_privilege", "GRANT INSERT ON users TO authenticated;", "insert"),
+    ("_extract_privilege", "GRANT UPDATE ON users TO authenticated;", "update"),
+    ("_extract_privilege", "GRANT DELETE ON users TO authenticated;", "delete"),
+    ("_extract_privilege", "GRANT ALL ON users TO authenticated;", "all"),
+    ("_extract_privilege", "GRANT ALL PRIVILEGES ON users TO authenticated;", "all"),
+    ("_extract_privilege", "GRANT SELECT, INSERT, UPDATE ON users TO authenticated;", "select"),
+    ("_extract_privilege", "REVOKE SELECT ON users FROM anon;", "select"),
+    ("_extract_privilege", "REVOKE ALL ON users FROM anon;", "all"),
+    ("_extract_privilege", "", "privilege"),
+    ("_extract_privilege", "SELECT * FROM users;", "privilege"),
+]
+
+
+@lru_cache(maxsize=256)
+def _ast_table_name(sql: str) -> str:
+    """Return the unqualified table name of a single statement, as seen by the Postgres parser."""
+    stmt = parse_sql(sql)[0].stmt
+    if isinstance(stmt, ast.DropStmt):
+        return stmt.objects[0][-1].sval
+    return stmt.relation.relname
+
+
+SAMPLE_DDL_QUERIES: dict[str, str] = {
+    "create_table": "CREATE TABLE users (id SERIAL PRIMARY KEY, name TEXT, email TEXT UNIQUE)",
+    "create_table_with_schema": "CREATE TABLE public.users (id SERIAL PRIMARY KEY, name TEXT, email TEXT UNIQUE)",
+    "create_table_custom_schema": "CREATE TABLE app.users (id SERIAL PRIMARY KEY, name TEXT, email TEXT UNIQUE)",
+    "alter_table": "ALTER TABLE users ADD COLUMN active BOOLEAN DEFAULT false",
+    "drop_table": "DROP TABLE users",
+    "truncate_table": "TRUNCATE TABLE users",
+    "create_index": "CREATE INDEX idx_user_email ON users (email)",
+}
+
+
+SAMPLE_EDGE_CASES: dict[str, str] = {
+    "with_comments": "SELECT * FROM users; -- This is a comment\n/* Multi-line\ncomment */",
+    "quoted_identifiers": 'SELECT * FROM "user table" WHERE "first name" = \'John\'',
+    "special_characters": "SELECT * FROM users WHERE name LIKE 'O''Brien%'",
+    "schema_qualified": "SELECT * FROM public.users",
+    "with_dollar_quotes": "SELECT $$This is a dollar-quoted string with 'quotes'$$ AS message",
+}
+
+
+SAMPLE_MULTIPLE_STATEMENTS: dict[str, str] = {
+    "multiple_ddl": "CREATE TABLE users (id SERIAL PRIMARY KEY); CREATE TABLE posts (id SERIAL PRIMARY KEY);",
+    "mixed_with_migration": "SELECT * FROM users; CREATE TABLE logs (id SERIAL PRIMARY KEY);",
+    "only_select": "SELECT * FROM users;",
+}
+
+
+SAMPLE_MIGRATION_QUERIES: dict[str, str] = {
+    "create_function": """
+    CREATE OR REPLACE FUNCTION auth.user_role(uid UUID)
+    RETURNS TEXT AS $$
+    DECLARE
+        role_name TEXT;
+    BEGIN
+        SELECT role INTO role_name FROM auth.users WHERE id = uid;
+        RETURN role_name;
+    END;
+    $$ LANGUAGE plpgsql SECURITY DEFINER;
+    """,
+    "create_table_with_comments": """
+    -- This is a comment at the beginning
+    CREATE TABLE public.comments (
+        id SERIAL PRIMARY KEY,
+        /* This is a multi-line comment
+           explaining the user_id field */
+        user_id UUID REFERENCES auth.users(id), -- Reference to users table
+        content TEXT NOT NULL, -- Comment content
+        created_at TIMESTAMP DEFAULT NOW() -- Creation timestamp
+    );
+    -- This is a comment at the end
+    """,
+    "create_test_table": "CREATE TABLE test_table (id SERIAL PRIMARY KEY);",
+    "insert_with_quotes": "INSERT INTO users (name) VALUES ('O''Brien');",
+    "insert_users": "INSERT INTO users (name, email) VALUES ('John', 'john@example.com');",
+    "update_users": "UPDATE users SET name = 'John', email = 'john@example.com' WHERE id = 1;",
+    "delete_users": "DELETE FROM users WHERE id = 1;",
+    "grant_select": "GRANT SELECT ON users TO anon;",
+    "revoke_all": "REVOKE ALL ON users FROM anon;",
+}
+
+
+@pytest.fixture(scope="module")
+def sample_ddl_queries() -> Mapping[str, str]:
     """Return a dictionary of sample DDL queries for testing."""
-    return {
-        "create_table": "CREATE TABLE users (id SERIAL PRIMARY KEY, name TEXT, email TEXT UNIQUE)",
-        "create_table_with_schema": "CREATE TABLE public.users (id SERIAL PRIMARY KEY, name TEXT, email TEXT UNIQUE)",
-        "create_table_custom_schema": "CREATE TABLE app.users (id SERIAL PRIMARY KEY, name TEXT, email TEXT UNIQUE)",
-        "alter_table": "ALTER TABLE users ADD COLUMN active BOOLEAN DEFAULT false",
-        "drop_table": "DROP TABLE users",
-        "truncate_table": "TRUNCATE TABLE users",
-        "create_index": "CREATE INDEX idx_user_email ON users (email)",
-    }
+    return MappingProxyType(SAMPLE_DDL_QUERIES)
 
 
-@pytest.fixture
-def sample_edge_cases() -> dict[str, str]:
+@pytest.fixture(scope="module")
+def sample_edge_cases() -> Mapping[str, str]:
     """Sample edge cases for testing."""
+    return MappingProxyType(SAMPLE_EDGE_CASES)
+
+
+@pytest.fixture(scope="module")
+def sample_multiple_statements() -> Mapping[str, str]:
+    """Sample SQL with multiple statements for testing batch processing."""
+    return MappingProxyType(SAMPLE_MULTIPLE_STATEMENTS)
+
+
+@pytest.fixture(scope="module")
+def sample_migration_queries() -> Mapping[str, str]:
+    """Sample queries used by the migration naming and preparation tests."""
+    return MappingProxyType(SAMPLE_MIGRATION_QUERIES)
+
+
+@pytest.fixture(scope="module")
+def validated_samples(
+    mock_validator: SQLValidator,
+    sample_ddl_queries: Mapping[str, str],
+    sample_edge_cases: Mapping[str, str],
+    sample_multiple_statements: Mapping[str, str],
+    sample_migration_queries: Mapping[str, str],
+) -> dict[str, QueryValidationResults]:
+    """Validate every sample query once per module, keyed by sample name."""
     return {
-        "with_comments": "SELECT * FROM users; -- This is a comment\n/* Multi-line\ncomment */",
-        "quoted_identifiers": 'SELECT * FROM "user table" WHERE "first name" = \'John\'',
-        "special_characters": "SELECT * FROM users WHERE name LIKE 'O''Brien%'",
-        "schema_qualified": "SELECT * FROM public.users",
-        "with_dollar_quotes": "SELECT $$This is a dollar-quoted string with 'quotes'$$ AS message",
+        name: mock_validator.validate_query(query)
+        for samples in (sample_ddl_queries, sample_edge_cases, sample_multiple_statements, sample_migration_queries)
+        for name, query in samples.items()
     }
 
 
-@pytest.fixture
-def sample_multiple_statements() -> dict[str, str]:
-    """Sample SQL with multiple statements for testing batch processing."""
+@pytest.fixture(scope="module")
+def mm_private() -> dict[str, Callable[..., str]]:
+    """Protected MigrationManager helpers, bound once per module and keyed by method name."""
+    manager = MigrationManager()
     return {
-        "multiple_ddl": "CREATE TABLE users (id SERIAL PRIMARY KEY); CREATE TABLE posts (id SERIAL PRIMARY KEY);",
-        "mixed_with_migration": "SELECT * FROM users; CREATE TABLE logs (id SERIAL PRIMARY KEY);",
-        "only_select": "SELECT * FROM users;",
+        name: getattr(manager, name)
+        for name in (
+            "_generate_short_hash",
+            "_generate_dml_name",
+            "_generate_dcl_name",
+            "_extract_table_name",
+            "_extract_function_name",
+            "_extract_view_name",
+            "_extract_index_name",
+            "_extract_extension_name",
+            "_extract_type_name",
+            "_extract_update_columns",
+            "_extract_privilege",
+            "_extract_dcl_object_name",
+            "_extract_generic_object_name",
+        )
     }
 
 
+@pytest.fixture
+def counting_timestamps(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace generate_query_timestamp with a deterministic, increasing 14-digit counter."""
+    counter = itertools.count(20240101000000)
+    monkeypatch.setattr(MigrationManager, "generate_query_timestamp", lambda self: str(next(counter)))
+
+
 class TestMigrationManager:
     """Tests for the MigrationManager class."""
 
     def test_generate_descriptive_name_with_default_schema(
-        self, mock_validator: SQLValidator, sample_ddl_queries: dict[str, str], migration_manager: MigrationManager
+        self, validated_samples: dict[str, QueryValidationResults], migration_manager: MigrationManager
     ):
         """Test generating a descriptive name with default schema."""
         # Use the create_table query from fixtures (no explicit schema)
-        result = mock_validator.validate_query(sample_ddl_queries["create_table"])
+        result = validated_samples["create_table"]
 
         # Generate a name using the migration manager fixture
         name = migration_manager.generate_descriptive_name(result)
 
         # Check that the name follows the expected format with default schema
-        assert name == "create_users_public_unknown"
+        assert name == "create_users_public_users"
 
     def test_generate_descriptive_name_with_explicit_schema(
-        self, mock_validator: SQLValidator, sample_ddl_queries: dict[str, str], migration_manager: MigrationManager
+        self, validated_samples: dict[str, QueryValidationResults], migration_manager: MigrationManager
     ):
         """Test generating a descriptive name with explicit schema."""
         # Use the create_table_with_schema query from fixtures
-        result = mock_validator.validate_query(sample_ddl_queries["create_table_with_schema"])
+        result = validated_samples["create_table_with_schema"]
 
         # Generate a name using the migration manager fixture
         name = migration_manager.generate_descriptive_name(result)
 
         # Check that the name follows the expected format with explicit schema
-        assert name == "create_users_public_unknown"
+        assert name == "create_users_public_users"
 
     def test_generate_descriptive_name_with_custom_schema(
-        self, mock_validator: SQLValidator, sample_ddl_queries: dict[str, str], migration_manager: MigrationManager
+        self, validated_samples: dict[str, QueryValidationResults], migration_manager: MigrationManager
     ):
         """Test generating a descriptive name with custom schema."""
         # Use the create_table_custom_schema query from fixtures
-        result = mock_validator.validate_query(sample_ddl_queries["create_table_custom_schema"])
+        result = validated_samples["create_table_custom_schema"]
 
         # Generate a name using the migration manager fixture
         name = migration_manager.generate_descriptive_name(result)
 
         # Check that the name follows the expected format with custom schema
-        assert name == "create_users_app_unknown"
+        assert name == "create_users_app_users"
 
     def test_generate_descriptive_name_with_multiple_statements(
-        self,
-        mock_validator: SQLValidator,
-        sample_multiple_statements: dict[str, str],
-        migration_manager: MigrationManager,
+        self, validated_samples: dict[str, QueryValidationResults], migration_manager: MigrationManager
     ):
         """Test generating a descriptive name with multiple statements."""
         # Use the multiple_ddl query from fixtures
-        result = mock_validator.validate_query(sample_multiple_statements["multiple_ddl"])
+        result = validated_samples["multiple_ddl"]
 
         # Generate a name using the migration manager fixture
         name = migration_manager.generate_descriptive_name(result)
@@ -101,14 +353,11 @@ class TestMigrationManager:
         assert name == "create_users_public_users"
 
     def test_generate_descriptive_name_with_mixed_statements(
-        self,
-        mock_validator: SQLValidator,
-        sample_multiple_statements: dict[str, str],
-        migration_manager: MigrationManager,
+        self, validated_samples: dict[str, QueryValidationResults], migration_manager: MigrationManager
     ):
         """Test generating a descriptive name with mixed statements."""
         # Use the mixed_with_migration query from fixtures
-        result = mock_validator.validate_query(sample_multiple_statements["mixed_with_migration"])
+        result = validated_samples["mixed_with_migration"]
 
         # Generate a name using the migration manager fixture
         name = migration_manager.generate_descriptive_name(result)
@@ -117,52 +366,47 @@ class TestMigrationManager:
         assert name == "create_logs_public_logs"
 
     def test_generate_descriptive_name_with_no_migration_statements(
-        self,
-        mock_validator: SQLValidator,
-        sample_multiple_statements: dict[str, str],
-        migration_manager: MigrationManager,
+        self, validated_samples: dict[str, QueryValidationResults], migration_manager: MigrationManager
     ):
         """Test generating a descriptive name with no statements that need migration."""
         # Use the only_select query from fixtures (renamed from only_tcl)
-        result = mock_validator.validate_query(sample_multiple_statements["only_select"])
+        result = validated_samples["only_select"]
 
         # Generate a name using the migration manager fixture
         name = migration_manager.generate_descriptive_name(result)
 
         # Check that a generic name is generated
-        assert re.match(r"migration_\w+", name)
+        assert MIGRATION_NAME_RE.match(name)
 
     def test_generate_descriptive_name_for_alter_table(
-        self, mock_validator: SQLValidator, sample_ddl_queries: dict[str, str], migration_manager: MigrationManager
+        self, validated_samples: dict[str, QueryValidationResults], migration_manager: MigrationManager
     ):
         """Test generating a descriptive name for ALTER TABLE statements."""
         # Use the alter_table query from fixtures
-        result = mock_validator.validate_query(sample_ddl_queries["alter_table"])
+        result = validated_samples["alter_table"]
 
         # Generate a name using the migration manager fixture
         name = migration_manager.generate_descriptive_name(result)
 
         # Check that the name follows the expected format for ALTER TABLE
-        assert name == "alter_users_public_unknown"
+        assert name == "alter_users_public_users"
 
-    def test_generate_descriptive_name_for_create_function(
+    def test_generate_descriptive_name_for_relation_ddl(
         self, mock_validator: SQLValidator, migration_manager: MigrationManager
+    ):
+        """Test that DDL on a table is named after the table, not the last word of the statement."""
+        result = mock_validator.validate_query("ALTER TABLE users ADD COLUMN active BOOLEAN DEFAULT false;")
+
+        name = migration_manager.generate_descriptive_name(result)
+
+        assert name == "alter_users_public_users"
+
+    def test_generate_descriptive_name_for_create_function(
+        self, validated_samples: dict[str, QueryValidationResults], migration_manager: MigrationManager
     ):
         """Test generating a descriptive name for CREATE FUNCTION statements."""
-        # Define a CREATE FUNCTION query
-        function_query = """
-        CREATE OR REPLACE FUNCTION auth.user_role(uid UUID)
-        RETURNS TEXT AS $$
-        DECLARE
-            role_name TEXT;
-        BEGIN
-            SELECT role INTO role_name FROM auth.users WHERE id = uid;
-            RETURN role_name;
-        END;
-        $$ LANGUAGE plpgsql SECURITY DEFINER;
-        """
-
-        result = mock_validator.validate_query(function_query)
+        # Use the CREATE FUNCTION query from fixtures
+        result = validated_samples["create_function"]
 
         # Generate a name using the migration manager fixture
         name = migration_manager.generate_descriptive_name(result)
@@ -171,24 +415,11 @@ class TestMigrationManager:
         assert name == "create_function_public_user_role"
 
     def test_generate_descriptive_name_with_comments(
-        self, mock_validator: SQLValidator, migration_manager: MigrationManager
+        self, validated_samples: dict[str, QueryValidationResults], migration_manager: MigrationManager
     ):
         """Test generating a descriptive name for SQL with comments."""
-        # Define a query with various types of comments
-        query_with_comments = """
-        -- This is a comment at the beginning
-        CREATE TABLE public.comments (
-            id SERIAL PRIMARY KEY,
-            /* This is a multi-line comment
-               explaining the user_id field */
-            user_id UUID REFERENCES auth.users(id), -- Reference to users table
-            content TEXT NOT NULL, -- Comment content
-            created_at TIMESTAMP DEFAULT NOW() -- Creation timestamp
-        );
-        -- This is a comment at the end
-        """
-
-        result = mock_validator.validate_query(query_with_comments)
+        # Use the query with various types of comments from fixtures
+        result = validated_samples["create_table_with_comments"]
 
         # Generate a name using the migration manager fixture
         name = migration_manager.generate_descriptive_name(result)
@@ -196,63 +427,67 @@ class TestMigrationManager:
         # Check that the name is correctly generated despite the comments
         assert name == "create_comments_public_comments"
 
-    def test_sanitize_name(self, migration_manager: MigrationManager):
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("simple_name", "simple_name"),
+            ("name with spaces", "name_with_spaces"),
+            ("name-with!special@chars#", "namewithspecialchars"),
+            ("UPPERCASE_NAME", "uppercase_name"),
+            ("a" * 150, "a" * 100),  # Truncated to 100 characters
+            ("User-Profile_Table!", "userprofile_table"),
+        ],
+    )
+    def test_sanitize_name(self, migration_manager: MigrationManager, name: str, expected: str):
         """Test the sanitize_name method with various inputs."""
-        # Test with simple name
-        assert migration_manager.sanitize_name("simple_name") == "simple_name"
-
-        # Test with spaces
-        assert migration_manager.sanitize_name("name with spaces") == "name_with_spaces"
-
-        # Test with special characters
-        assert migration_manager.sanitize_name("name-with!special@chars#") == "namewithspecialchars"
-
-        # Test with uppercase
-        assert migration_manager.sanitize_name("UPPERCASE_NAME") == "uppercase_name"
+        assert migration_manager.sanitize_name(name) == expected
 
-        # Test with very long name (over 100 chars)
-        long_name = "a" * 150
-        assert len(migration_manager.sanitize_name(long_name)) == 100
-
-        # Test with mixed case and special chars
-        assert migration_manager.sanitize_name("User-Profile_Table!") == "userprofile_table"
-
-    def test_prepare_migration_query(self, mock_validator: SQLValidator, migration_manager: MigrationManager):
+    @pytest.mark.usefixtures("counting_timestamps")
+    def test_prepare_migration_query(
+        self,
+        sample_migration_queries: Mapping[str, str],
+        validated_samples: dict[str, QueryValidationResults],
+        migration_manager: MigrationManager,
+    ):
         """Test the prepare_migration_query method."""
-        # Create a sample query and validate it
-        query = "CREATE TABLE test_table (id SERIAL PRIMARY KEY);"
-        result = mock_validator.validate_query(query)
+        prepare_migration_query = migration_manager.prepare_migration_query
+
+        # Use a validated sample query
+        query = sample_migration_queries["create_test_table"]
+        result = validated_samples["create_test_table"]
+        escaped_query = query.replace("'", "''")
 
         # Test with client-provided name
-        migration_query, name = migration_manager.prepare_migration_query(result, query, "my_custom_migration")
+        migration_query, name = prepare_migration_query(result, query, "my_custom_migration")
         assert name == "my_custom_migration"
         assert "INSERT INTO supabase_migrations.schema_migrations" in migration_query
         assert "my_custom_migration" in migration_query
-        assert query.replace("'", "''") in migration_query
+        assert escaped_query in migration_query
 
         # Test with auto-generated name
-        migration_query, name = migration_manager.prepare_migration_query(result, query)
+        migration_query, name = prepare_migration_query(result, query)
         assert name  # Name should not be empty
         assert "INSERT INTO supabase_migrations.schema_migrations" in migration_query
         assert name in migration_query
-        assert query.replace("'", "''") in migration_query
+        assert escaped_query in migration_query
 
         # Test with query containing single quotes (SQL injection prevention)
-        query_with_quotes = "INSERT INTO users (name) VALUES ('O''Brien');"
-        result = mock_validator.validate_query(query_with_quotes)
-        migration_query, _ = migration_manager.prepare_migration_query(result, query_with_quotes)
+        query_with_quotes = sample_migration_queries["insert_with_quotes"]
+        result = validated_samples["insert_with_quotes"]
+        migration_query, _ = prepare_migration_query(result, query_with_quotes)
+        escaped_query_with_quotes = query_with_quotes.replace("'", "''")
         # The single quotes are already escaped in the original query, and they get escaped again
-        assert "VALUES (''O''''Brien'')" in migration_query
+        assert escaped_query_with_quotes in migration_query
+        assert "VALUES (''O''''Brien'')" in escaped_query_with_quotes
 
-    def test_generate_short_hash(self, migration_manager: MigrationManager):
+    def test_generate_short_hash(self, mm_private: dict[str, Callable[..., str]]):
         """Test the _generate_short_hash method."""
-        # Use getattr to access protected method
-        generate_short_hash = getattr(migration_manager, "_generate_short_hash")  # noqa
+        generate_short_hash = mm_private["_generate_short_hash"]
 
         # Test with simple string
         hash1 = generate_short_hash("test string")
         assert len(hash1) == 8  # Should be 8 characters
-        assert re.match(r"^[0-9a-f]{8}$", hash1)  # Should be hexadecimal
+        int(hash1, 16)  # Should be hexadecimal (raises ValueError otherwise)
 
         # Test with empty string
         hash2 = generate_short_hash("")
@@ -266,333 +501,70 @@ class TestMigrationManager:
         hash4 = generate_short_hash("different string")
         assert hash1 != hash4
 
-    def test_generate_dml_name(self, mock_validator: SQLValidator, migration_manager: MigrationManager):
+    def test_generate_dml_name(
+        self, validated_samples: dict[str, QueryValidationResults], mm_private: dict[str, Callable[..., str]]
+    ):
         """Test the _generate_dml_name method."""
-        generate_dml_name = getattr(migration_manager, "_generate_dml_name")  # noqa
+        generate_dml_name = mm_private["_generate_dml_name"]
 
         # Test INSERT statement
-        insert_query = "INSERT INTO users (name, email) VALUES ('John', 'john@example.com');"
-        result = mock_validator.validate_query(insert_query)
-        statement = result.statements[0]
+        statement = validated_samples["insert_users"].statements[0]
         name = generate_dml_name(statement)
         assert name == "insert_public_users"
 
         # Test UPDATE statement with column extraction
-        update_query = "UPDATE users SET name = 'John', email = 'john@example.com' WHERE id = 1;"
-        result = mock_validator.validate_query(update_query)
-        statement = result.statements[0]
+        statement = validated_samples["update_users"].statements[0]
         name = generate_dml_name(statement)
         assert "update" in name
         assert "users" in name
 
         # Test DELETE statement
-        delete_query = "DELETE FROM users WHERE id = 1;"
-        result = mock_validator.validate_query(delete_query)
-        statement = result.statements[0]
+        statement = validated_samples["delete_users"].statements[0]
         name = generate_dml_name(statement)
         assert name == "delete_public_users"
 
-    def test_generate_dcl_name(self, mock_validator: SQLValidator, migration_manager: MigrationManager):
+    def test_generate_dcl_name(
+        self, validated_samples: dict[str, QueryValidationResults], mm_private: dict[str, Callable[..., str]]
+    ):
         """Test the _generate_dcl_name method."""
-        generate_dcl_name = getattr(migration_manager, "_generate_dcl_name")  # noqa
+        generate_dcl_name = mm_private["_generate_dcl_name"]
 
         # Test GRANT statement
-        grant_query = "GRANT SELECT ON users TO anon;"
-        result = mock_validator.validate_query(grant_query)
-        statement = result.statements[0]
+        statement = validated_samples["grant_select"].statements[0]
         name = generate_dcl_name(statement)
         assert "grant" in name
         assert "select" in name
         assert "users" in name
 
         # Test REVOKE statement
-        revoke_query = "REVOKE ALL ON users FROM anon;"
-        result = mock_validator.validate_query(revoke_query)
-        statement = result.statements[0]
+        statement = validated_samples["revoke_all"].statements[0]
         name = generate_dcl_name(statement)
         # The implementation doesn't actually use the command from the statement
         # It always uses "grant" in the name regardless of whether it's GRANT or REVOKE
         assert "all" in name
         assert "users" in name
 
-    def test_extract_table_name(self, migration_manager: MigrationManager):
-        """Test the _extract_table_name method."""
-        extract_table_name = getattr(migration_manager, "_extract_table_name")  # noqa
-
-        # Test CREATE TABLE
-        assert extract_table_name("CREATE TABLE users (id SERIAL PRIMARY KEY);") == "users"
-        assert extract_table_name("CREATE TABLE IF NOT EXISTS users (id SERIAL PRIMARY KEY);") == "users"
-        assert extract_table_name("CREATE TABLE public.users (id SERIAL PRIMARY KEY);") == "users"
-
-        # Test ALTER TABLE
-        assert extract_table_name("ALTER TABLE users ADD COLUMN email TEXT;") == "users"
-        assert extract_table_name("ALTER TABLE public.users ADD COLUMN email TEXT;") == "users"
-
-        # Test DROP TABLE
-        assert extract_table_name("DROP TABLE users;") == "users"
-        assert extract_table_name("DROP TABLE IF EXISTS users;") == "users"
-        assert extract_table_name("DROP TABLE public.users;") == "users"
-
-        # Test DML statements
-        assert extract_table_name("INSERT INTO users (name) VALUES ('John');") == "users"
-        assert extract_table_name("UPDATE users SET name = 'John' WHERE id = 1;") == "users"
-        assert extract_table_name("DELETE FROM users WHERE id = 1;") == "users"
-
-        # Test with empty or invalid input
-        assert extract_table_name("") == "unknown"
-        assert extract_table_name("SELECT * FROM users;") == "unknown"  # Not handled by this method
-
-    def test_extract_function_name(self, migration_manager: MigrationManager):
-        """Test the _extract_function_name method."""
-        extract_function_name = getattr(migration_manager, "_extract_function_name")  # noqa
-
-        # Test CREATE FUNCTION
-        assert (
-            extract_function_name(
-                "CREATE FUNCTION get_user() RETURNS SETOF users AS $$ SELECT * FROM users; $$ LANGUAGE SQL;"
-            )
-            == "get_user"
-        )
-        assert (
-            extract_function_name(
-                "CREATE OR REPLACE FUNCTION get_user() RETURNS SETOF users AS $$ SELECT * FROM users; $$ LANGUAGE SQL;"
-            )
-            == "get_user"
-        )
-        assert (
-            extract_function_name(
-                "CREATE FUNCTION public.get_user() RETURNS SETOF users AS $$ SELECT * FROM users; $$ LANGUAGE SQL;"
-            )
-            == "get_user"
-        )
-
-        # Test ALTER FUNCTION
-        assert extract_function_name("ALTER FUNCTION get_user() SECURITY DEFINER;") == "get_user"
-        assert extract_function_name("ALTER FUNCTION public.get_user() SECURITY DEFINER;") == "get_user"
-
-        # Test DROP FUNCTION
-        assert extract_function_name("DROP FUNCTION get_user();") == "get_user"
-        assert extract_function_name("DROP FUNCTION public.get_user();") == "get_user"
-
-        # Test with empty or invalid input
-        assert extract_function_name("") == "unknown"
-        assert extract_function_name("SELECT * FROM users;") == "unknown"
-
-    def test_extract_view_name(self, migration_manager: MigrationManager):
-        """Test the _extract_view_name method."""
-        extract_view_name = getattr(migration_manager, "_extract_view_name")  # noqa
-
-        # Test CREATE VIEW
-        assert extract_view_name("CREATE VIEW user_view AS SELECT * FROM users;") == "user_view"
-        assert extract_view_name("CREATE OR REPLACE VIEW user_view AS SELECT * FROM users;") == "user_view"
-        assert extract_view_name("CREATE VIEW public.user_view AS SELECT * FROM users;") == "user_view"
-
-        # Test ALTER VIEW
-        assert extract_view_name("ALTER VIEW user_view RENAME TO users_view;") == "user_view"
-        assert extract_view_name("ALTER VIEW public.user_view RENAME TO users_view;") == "user_view"
-
-        # Test DROP VIEW
-        assert extract_view_name("DROP VIEW user_view;") == "user_view"
-        assert extract_view_name("DROP VIEW public.user_view;") == "user_view"
-
-        # Test with empty or invalid input
-        assert extract_view_name("") == "unknown"
-        assert extract_view_name("SELECT * FROM users;") == "unknown"
-
-    def test_extract_index_name(self, migration_manager: MigrationManager):
-        """Test the _extract_index_name method."""
-        extract_index_name = getattr(migration_manager, "_extract_index_name")  # noqa
-
-        # Test CREATE INDEX
-        assert extract_index_name("CREATE INDEX idx_user_email ON users (email);") == "idx_user_email"
-        assert extract_index_name("CREATE INDEX IF NOT EXISTS idx_user_email ON users (email);") == "idx_user_email"
-        assert extract_index_name("CREATE INDEX public.idx_user_email ON users (email);") == "idx_user_email"
-
-        # Test DROP INDEX
-        assert extract_index_name("DROP INDEX idx_user_email;") == "idx_user_email"
-        # The current implementation doesn't handle IF EXISTS correctly
-        # Let's modify our test to match the actual behavior
-        # Instead of:
-        # assert extract_index_name("DROP INDEX IF EXISTS idx_user_email;") == "idx_user_email"
-        # We'll use:
-        drop_index_query = "DROP INDEX idx_user_email;"
-        assert extract_index_name(drop_index_query) == "idx_user_email"
-
-        # Test with empty or invalid input
-        assert extract_index_name("") == "unknown"
-        assert extract_index_name("SELECT * FROM users;") == "unknown"
-
-    def test_extract_extension_name(self, migration_manager: MigrationManager):
-        """Test the _extract_extension_name method."""
-        extract_extension_name = getattr(migration_manager, "_extract_extension_name")  # noqa
-
-        # Test CREATE EXTENSION
-        assert extract_extension_name("CREATE EXTENSION pgcrypto;") == "pgcrypto"
-        assert extract_extension_name("CREATE EXTENSION IF NOT EXISTS pgcrypto;") == "pgcrypto"
-
-        # Test ALTER EXTENSION
-        assert extract_extension_name("ALTER EXTENSION pgcrypto UPDATE TO '1.3';") == "pgcrypto"
-
-        # Test DROP EXTENSION
-        assert extract_extension_name("DROP EXTENSION pgcrypto;") == "pgcrypto"
-        # The current implementation doesn't handle IF EXISTS correctly
-        # Let's modify our test to match the actual behavior
-        # Instead of:
-        # assert extract_extension_name("DROP EXTENSION IF EXISTS pgcrypto;") == "pgcrypto"
-        # We'll use:
-        drop_extension_query = "DROP EXTENSION pgcrypto;"
-        assert extract_extension_name(drop_extension_query) == "pgcrypto"
-
-        # Test with empty or invalid input
-        assert extract_extension_name("") == "unknown"
-        assert extract_extension_name("SELECT * FROM users;") == "unknown"
-
-    def test_extract_type_name(self, migration_manager: MigrationManager):
-        """Test the _extract_type_name method."""
-        extract_type_name = getattr(migration_manager, "_extract_type_name")  # noqa
-
-        # Test CREATE TYPE (ENUM)
-        assert (
-            extract_type_name("CREATE TYPE user_status AS ENUM ('active', 'inactive', 'suspended');") == "user_status"
-        )
-        assert (
-            extract_type_name("CREATE TYPE public.user_status AS ENUM ('active', 'inactive', 'suspended');")
-            == "user_status"
-        )
-
-        # Test CREATE DOMAIN
-        assert (
-            extract_type_name(
-                "CREATE DOMAIN email_address AS TEXT CHECK (VALUE ~ '^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$');"
-            )
-            == "email_address"
-        )
-        assert (
-            extract_type_name(
-                "CREATE DOMAIN public.email_address AS TEXT CHECK (VALUE ~ '^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$');"
-            )
-            == "email_address"
-        )
-
-        # Test ALTER TYPE
-        assert extract_type_name("ALTER TYPE user_status ADD VALUE 'pending';") == "user_status"
-        assert extract_type_name("ALTER TYPE public.user_status ADD VALUE 'pending';") == "user_status"
-
-        # Test DROP TYPE
-        assert extract_type_name("DROP TYPE user_status;") == "user_status"
-        assert extract_type_name("DROP TYPE public.user_status;") == "user_status"
-
-        # Test with empty or invalid input
-        assert extract_type_name("") == "unknown"
-        assert extract_type_name("SELECT * FROM users;") == "unknown"
-
-    def test_extract_update_columns(self, migration_manager: MigrationManager):
-        """Test the _extract_update_columns method."""
-        extract_update_columns = getattr(migration_manager, "_extract_update_columns")  # noqa
-
-        # The current implementation seems to have issues with the regex pattern
-        # Let's test what it actually returns rather than what we expect
-        update_query = "UPDATE users SET name = 'John' WHERE id = 1;"
-        result = extract_update_columns(update_query)
-        assert result == ""  # Accept the actual behavior
-
-        # Test with multiple columns
-        multi_column_query = "UPDATE users SET name = 'John', email = 'john@example.com', active = true WHERE id = 1;"
-        result = extract_update_columns(multi_column_query)
-        assert result == ""  # Accept the actual behavior
-
-        # Test with more than 3 columns
-        many_columns_query = "UPDATE users SET name = 'John', email = 'john@example.com', active = true, created_at = NOW(), updated_at = NOW() WHERE id = 1;"
-        result = extract_update_columns(many_columns_query)
-        assert result == ""  # Accept the actual behavior
-
-        # Test with empty or invalid input
-        assert extract_update_columns("") == ""
-        assert extract_update_columns("SELECT * FROM users;") == ""
-
-        # Test with a query that doesn't match the regex pattern
-        assert extract_update_columns("UPDATE users SET name = 'John'") == ""
-
-    def test_extract_privilege(self, migration_manager: MigrationManager):
-        """Test the _extract_privilege method."""
-        extract_privilege = getattr(migration_manager, "_extract_privilege")  # noqa
-
-        # Test with SELECT privilege
-        assert extract_privilege("GRANT SELECT ON users TO anon;") == "select"
-
-        # Test with INSERT privilege
-        assert extract_privilege("GRANT INSERT ON users TO authenticated;") == "insert"
-
-        # Test with UPDATE privilege
-        assert extract_privilege("GRANT UPDATE ON users TO authenticated;") == "update"
-
-        # Test with DELETE privilege
-        assert extract_privilege("GRANT DELETE ON users TO authenticated;") == "delete"
-
-        # Test with ALL privileges
-        assert extract_privilege("GRANT ALL ON users TO authenticated;") == "all"
-        assert extract_privilege("GRANT ALL PRIVILEGES ON users TO authenticated;") == "all"
-
-        # Test with multiple privileges
-        assert extract_privilege("GRANT SELECT, INSERT, UPDATE ON users TO authenticated;") == "select"
-
-        # Test with REVOKE
-        assert extract_privilege("REVOKE SELECT ON users FROM anon;") == "select"
-        assert extract_privilege("REVOKE ALL ON users FROM anon;") == "all"
-
-        # Test with empty or invalid input
-        assert extract_privilege("") == "privilege"
-        assert extract_privilege("SELECT * FROM users;") == "privilege"
-
-    def test_extract_dcl_object_name(self, migration_manager: MigrationManager):
-        """Test the _extract_dcl_object_name method."""
-        extract_dcl_object_name = getattr(migration_manager, "_extract_dcl_object_name")  # noqa
-
-        # Test with table
-        assert extract_dcl_object_name("GRANT SELECT ON users TO anon;") == "users"
-        assert extract_dcl_object_name("GRANT SELECT ON TABLE users TO anon;") == "users"
-        assert extract_dcl_object_name("GRANT SELECT ON public.users TO anon;") == "users"
-        assert extract_dcl_object_name("GRANT SELECT ON TABLE public.users TO anon;") == "users"
-
-        # Test with REVOKE
-        assert extract_dcl_object_name("REVOKE SELECT ON users FROM anon;") == "users"
-        assert extract_dcl_object_name("REVOKE SELECT ON TABLE users FROM anon;") == "users"
-
-        # Test with empty or invalid input
-        assert extract_dcl_object_name("") == "unknown"
-        assert extract_dcl_object_name("SELECT * FROM users;") == "unknown"
-
-    def test_extract_generic_object_name(self, migration_manager: MigrationManager):
-        """Test the _extract_generic_object_name method."""
-        extract_generic_object_name = getattr(migration_manager, "_extract_generic_object_name")  # noqa
-
-        # Test with CREATE statement
-        assert extract_generic_object_name("CREATE SCHEMA app;") == "app"
+    @pytest.mark.parametrize("method_name,sql,expected", EXTRACT_CASES)
+    def test_extract_object_name(
+        self, mm_private: dict[str, Callable[..., str]], method_name: str, sql: str, expected: str
+    ):
+        """Test the protected _extract_* helpers against one statement each."""
+        assert mm_private[method_name](sql) == expected
 
-        # Test with ALTER statement
-        assert extract_generic_object_name("ALTER SCHEMA app RENAME TO application;") == "application"
+    @pytest.mark.parametrize("sql", TABLE_STATEMENTS)
+    def test_extract_table_name_matches_parse_tree(self, mm_private: dict[str, Callable[..., str]], sql: str):
+        """Test that _extract_table_name agrees with the table named in the parsed statement."""
+        assert mm_private["_extract_table_name"](sql) == _ast_table_name(sql)
 
-        # Test with DROP statement
-        assert extract_generic_object_name("DROP SCHEMA app;") == "app"
+    def test_extract_generic_object_name_with_on_clause(self, mm_private: dict[str, Callable[..., str]]):
+        """Test _extract_generic_object_name on a COMMENT ON statement."""
+        extract_generic_object_name = mm_private["_extract_generic_object_name"]
 
-        # Test with ON clause - the implementation looks for patterns in a specific order
-        # and the first pattern that matches is used
-        # For "COMMENT ON TABLE users", the first pattern that matches is the DDL pattern
-        # which captures "TABLE" as the object name
-        comment_query = "COMMENT ON TABLE users IS 'User accounts';"
-        result = extract_generic_object_name(comment_query)
+        # The implementation looks for patterns in a specific order and the first pattern that matches is used.
+        # For "COMMENT ON TABLE users", the DDL pattern matches first and captures "TABLE" as the object name
+        result = extract_generic_object_name("COMMENT ON TABLE users IS 'User accounts';")
         assert result in ["TABLE", "users"]  # Accept either result
 
-        # Test with FROM clause
-        assert extract_generic_object_name("SELECT * FROM users;") == "users"
-
-        # Test with INTO clause
-        assert extract_generic_object_name("INSERT INTO users (name) VALUES ('John');") == "users"
-
-        # Test with empty or invalid input
-        assert extract_generic_object_name("") == "unknown"
-        assert extract_generic_object_name("BEGIN;") == "unknown"
-
     def test_generate_query_timestamp(self, migration_manager: MigrationManager):
         """Test the generate_query_timestamp method."""
         # Get timestamp
@@ -600,11 +572,9 @@ class TestMigrationManager:
 
         # Verify format (YYYYMMDDHHMMSS)
         assert len(timestamp) == 14
-        assert re.match(r"^\d{14}$", timestamp)
-
-        # Verify it's a valid timestamp by parsing it
-        import datetime
+        assert TIMESTAMP14_RE.match(timestamp)
 
+        # Verify it's a valid timestamp by parsing it (only reached once the format check passed)
         try:
             datetime.datetime.strptime(timestamp, "%Y%m%d%H%M%S")
             is_valid = True
@@ -653,6 +623,7 @@ class TestMigrationManager:
         # Verify it's using the ARRAY constructor for statements
         assert "ARRAY[" in create_query
 
+    @pytest.mark.usefixtures("counting_timestamps")
     def test_migration_system_handles_nonexistent_schema(
         self, migration_manager: MigrationManager, mock_validator: SQLValidator
     ):
@@ -674,9 +645,8 @@ class TestMigrationManager:
         # Get the initialization query
         init_query = migration_manager.loader.get_init_migrations_query()
 
-        # Verify it creates the schema and table with IF NOT EXISTS
-        assert "CREATE SCHEMA IF NOT EXISTS" in init_query
-        assert "CREATE TABLE IF NOT EXISTS" in init_query
+        # Verify it creates the schema and then the table with IF NOT EXISTS
+        assert INIT_MIGRATIONS_RE.search(init_query)
 
         # Get a create migration query
         version = migration_manager.generate_query_timestamp()
@@ -686,6 +656,7 @@ class TestMigrationManager:
 
         # Verify it assumes the table exists (no IF EXISTS check)
         assert "INSERT INTO supabase_migrations.schema_migrations" in create_query
+        assert f"'{version}'" in create_query
 
         # This is why the QueryManager needs to call init_migration_schema before
         # attempting to create a migration - to ensure the table exists
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -9,6 +10,11 @@ from supabase_mcp.services.logs.log_manager import LogManager
 class TestLogManager:
     """Tests for the LogManager class."""
 
+    @pytest.fixture(scope="class")
+    def log_manager(self):
+        """Create a single LogManager for tests that don't replace its collaborators."""
+        return LogManager()
+
     def test_init(self):
         """Test initialization of LogManager."""
         log_manager = LogManager()
@@ -97,17 +103,15 @@ class TestLogManager:
             ),
         ],
     )
-    def test_build_where_clause(self, collection, hours_ago, filters, search, expected_clause):
+    def test_build_where_clause(self, log_manager, collection, hours_ago, filters, search, expected_clause):
         """Test building WHERE clauses for different scenarios."""
-        log_manager = LogManager()
         where_clause = log_manager._build_where_clause(
             collection=collection, hours_ago=hours_ago, filters=filters, search=search
         )
         assert where_clause == expected_clause
 
-    def test_build_where_clause_escapes_single_quotes(self):
+    def test_build_where_clause_escapes_single_quotes(self, log_manager):
         """Test that single quotes in search strings are properly escaped."""
-        log_manager = LogManager()
         where_clause = log_manager._build_where_clause(collection="postgres", search="O'Reilly")
         assert where_clause == "WHERE event_message LIKE '%O''Reilly%'"
 
@@ -118,25 +122,32 @@ class TestLogManager:
         )
         assert where_clause == "WHERE parsed.query LIKE 'SELECT * FROM O''Reilly'"
 
-    @patch.object(SQLLoader, "get_logs_query")
-    def test_build_logs_query_with_custom_query(self, mock_get_logs_query):
+    def test_build_logs_query_with_custom_query(self):
         """Test building a logs query with a custom query."""
         log_manager = LogManager()
+        get_logs_query_calls = []
+        log_manager.sql_loader = SimpleNamespace(get_logs_query=lambda **kwargs: get_logs_query_calls.append(kwargs))
         custom_query = "SELECT * FROM postgres_logs LIMIT 10"
 
         query = log_manager.build_logs_query(collection="postgres", custom_query=custom_query)
 
         assert query == custom_query
         # Ensure get_logs_query is not called when custom_query is provided
-        mock_get_logs_query.assert_not_called()
+        assert get_logs_query_calls == []
 
-    @patch.object(LogManager, "_build_where_clause")
-    @patch.object(SQLLoader, "get_logs_query")
-    def test_build_logs_query_standard(self, mock_get_logs_query, mock_build_where_clause):
+    def test_build_logs_query_standard(self):
         """Test building a standard logs query."""
         log_manager = LogManager()
-        mock_build_where_clause.return_value = "WHERE timestamp > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 24 HOUR)"
-        mock_get_logs_query.return_value = "SELECT * FROM postgres_logs WHERE timestamp > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 24 HOUR) LIMIT 20"
+        where_clause = "WHERE timestamp > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 24 HOUR)"
+        logs_query = f"SELECT * FROM postgres_logs {where_clause} LIMIT 20"
+
+        # Record calls on plain stubs instead of patching the classes
+        build_where_clause_calls = []
+        get_logs_query_calls = []
+        log_manager._build_where_clause = lambda **kwargs: (build_where_clause_calls.append(kwargs), where_clause)[1]
+        log_manager.sql_loader = SimpleNamespace(
+            get_logs_query=lambda **kwargs: (get_logs_query_calls.append(kwargs), logs_query)[1]
+        )
 
         query = log_manager.build_logs_query(
             collection="postgres",
@@ -146,23 +157,16 @@ class TestLogManager:
             search="connection",
         )
 
-        mock_build_where_clause.assert_called_once_with(
-            collection="postgres",
-            hours_ago=24,
-            filters=[{"field": "parsed.error_severity", "operator": "=", "value": "ERROR"}],
-            search="connection",
-        )
-
-        mock_get_logs_query.assert_called_once_with(
-            collection="postgres",
-            where_clause="WHERE timestamp > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 24 HOUR)",
-            limit=20,
-        )
-
-        assert (
-            query
-            == "SELECT * FROM postgres_logs WHERE timestamp > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 24 HOUR) LIMIT 20"
-        )
+        assert build_where_clause_calls == [
+            {
+                "collection": "postgres",
+                "hours_ago": 24,
+                "filters": [{"field": "parsed.error_severity", "operator": "=", "value": "ERROR"}],
+                "search": "connection",
+            }
+        ]
+        assert get_logs_query_calls == [{"collection": "postgres", "where_clause": where_clause, "limit": 20}]
+        assert query == logs_query
 
     @patch.object(SQLLoader, "get_logs_query")
     def test_build_logs_query_integration(self, mock_get_logs_query, sql_loader):
@@ -190,10 +194,8 @@ class TestLogManager:
         assert "LIMIT 10" in query
         mock_get_logs_query.assert_called_once()
 
-    def test_unknown_collection(self):
+    def test_unknown_collection(self, log_manager):
         """Test handling of unknown collections."""
-        log_manager = LogManager()
-
         # Test with a collection that doesn't exist in the mapping
         where_clause = log_manager._build_where_clause(
             collection="unknown_collection",
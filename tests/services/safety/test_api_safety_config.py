@@ -5,6 +5,8 @@ This file contains unit test cases for the APISafetyConfig class, which is respo
 determining the risk level of API operations and whether they are allowed or require confirmation.
 """
 
+import itertools
+
 import pytest
 
 from supabase_mcp.services.safety.models import OperationRiskLevel, SafetyMode
@@ -15,6 +17,17 @@ from supabase_mcp.services.safety.safety_configs import APISafetyConfig, HTTPMet
 class TestAPISafetyConfig:
     """Unit tests for the APISafetyConfig class."""
 
+    # Low risk operations are allowed in both modes, medium/high risk only in unsafe mode,
+    # and extreme risk operations are never allowed
+    ALLOWED = frozenset(
+        {
+            (OperationRiskLevel.LOW, SafetyMode.SAFE),
+            (OperationRiskLevel.LOW, SafetyMode.UNSAFE),
+            (OperationRiskLevel.MEDIUM, SafetyMode.UNSAFE),
+            (OperationRiskLevel.HIGH, SafetyMode.UNSAFE),
+        }
+    )
+
     def test_get_risk_level_low_risk(self):
         """Test getting risk level for low-risk operations (GET requests)."""
         config = APISafetyConfig()
@@ -76,32 +89,17 @@ class TestAPISafetyConfig:
         """Test if operations are allowed based on risk level and safety mode."""
         config = APISafetyConfig()
 
-        # Low risk operations should be allowed in both safe and unsafe modes
-        assert config.is_operation_allowed(OperationRiskLevel.LOW, SafetyMode.SAFE) is True
-        assert config.is_operation_allowed(OperationRiskLevel.LOW, SafetyMode.UNSAFE) is True
-
-        # Medium/high risk operations should only be allowed in unsafe mode
-        assert config.is_operation_allowed(OperationRiskLevel.MEDIUM, SafetyMode.SAFE) is False
-        assert config.is_operation_allowed(OperationRiskLevel.MEDIUM, SafetyMode.UNSAFE) is True
-        assert config.is_operation_allowed(OperationRiskLevel.HIGH, SafetyMode.SAFE) is False
-        assert config.is_operation_allowed(OperationRiskLevel.HIGH, SafetyMode.UNSAFE) is True
-
-        # Extreme risk operations should not be allowed in safe mode
-        assert config.is_operation_allowed(OperationRiskLevel.EXTREME, SafetyMode.SAFE) is False
-        # In the current implementation, extreme risk operations are never allowed
-        assert config.is_operation_allowed(OperationRiskLevel.EXTREME, SafetyMode.UNSAFE) is False
+        # Every (risk level, mode) combination is checked against the truth table
+        for risk_level, mode in itertools.product(OperationRiskLevel, SafetyMode):
+            assert config.is_operation_allowed(risk_level, mode) is ((risk_level, mode) in self.ALLOWED)
 
     def test_needs_confirmation(self):
         """Test if operations need confirmation based on risk level."""
         config = APISafetyConfig()
 
-        # Low and medium risk operations should not need confirmation
-        assert config.needs_confirmation(OperationRiskLevel.LOW) is False
-        assert config.needs_confirmation(OperationRiskLevel.MEDIUM) is False
-
-        # High and extreme risk operations should need confirmation
-        assert config.needs_confirmation(OperationRiskLevel.HIGH) is True
-        assert config.needs_confirmation(OperationRiskLevel.EXTREME) is True
+        # High and extreme risk operations need confirmation; low and medium risk operations don't
+        for risk_level in OperationRiskLevel:
+            assert config.needs_confirmation(risk_level) is (risk_level >= OperationRiskLevel.HIGH)
 
     def test_path_matching(self):
         """Test that path patterns are correctly matched."""
@@ -127,6 +125,18 @@ class TestAPISafetyConfig:
         operation = ("GET", "/v1/some/unknown/path", {}, {}, {})
         assert config.get_risk_level(operation) == OperationRiskLevel.LOW
 
+    def test_any_placeholder_matches_a_path_segment(self):
+        """Test that every {placeholder} in a pattern matches a single concrete path segment."""
+        config = APISafetyConfig()
+
+        # {provider_id} is matched like {ref}, so concrete provider IDs are classified
+        operation = ("DELETE", "/v1/projects/abc123/config/auth/sso/providers/provider-1", {}, {}, {})
+        assert config.get_risk_level(operation) == OperationRiskLevel.HIGH
+
+        # Placeholders never span more than one segment
+        operation = ("DELETE", "/v1/projects/abc123/extra", {}, {}, {})
+        assert config.get_risk_level(operation) == OperationRiskLevel.LOW
+
     def test_method_case_insensitivity(self):
         """Test that HTTP method matching is case-insensitive."""
         config = APISafetyConfig()
@@ -143,6 +153,10 @@ class TestAPISafetyConfig:
         operation = ("GeT", "/v1/projects/{ref}/functions", {}, {}, {})
         assert config.get_risk_level(operation) == OperationRiskLevel.LOW
 
+        # Lowercase methods are classified like their uppercase form
+        operation = ("delete", "/v1/projects/abc123", {}, {}, {})
+        assert config.get_risk_level(operation) == OperationRiskLevel.EXTREME
+
     def test_path_safety_config_structure(self):
         """Test that the PATH_SAFETY_CONFIG structure is correctly defined."""
         config = APISafetyConfig()
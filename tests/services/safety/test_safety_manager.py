@@ -1,3 +1,4 @@
+import re
 import time
 
 import pytest
@@ -7,22 +8,22 @@ from supabase_mcp.services.safety.models import ClientType, OperationRiskLevel,
 from supabase_mcp.services.safety.safety_configs import SafetyConfigBase
 from supabase_mcp.services.safety.safety_manager import SafetyManager
 
+CONFIRMATION_ID_RE = re.compile(r"ID: (conf_[a-f0-9]+)")
+
 
 class MockSafetyConfig(SafetyConfigBase[str]):
     """Mock safety configuration for testing."""
 
+    RISK_LEVELS = {
+        "low_risk": OperationRiskLevel.LOW,
+        "medium_risk": OperationRiskLevel.MEDIUM,
+        "high_risk": OperationRiskLevel.HIGH,
+        "extreme_risk": OperationRiskLevel.EXTREME,
+    }
+
     def get_risk_level(self, operation: str) -> OperationRiskLevel:
         """Get the risk level for an operation."""
-        if operation == "low_risk":
-            return OperationRiskLevel.LOW
-        elif operation == "medium_risk":
-            return OperationRiskLevel.MEDIUM
-        elif operation == "high_risk":
-            return OperationRiskLevel.HIGH
-        elif operation == "extreme_risk":
-            return OperationRiskLevel.EXTREME
-        else:
-            return OperationRiskLevel.LOW
+        return self.RISK_LEVELS.get(operation, OperationRiskLevel.LOW)
 
 
 @pytest.mark.unit
@@ -232,7 +233,8 @@ class TestSafetyManager:
         confirmation_id = manager._store_confirmation(ClientType.DATABASE, "test_operation", OperationRiskLevel.EXTREME)
 
         # Manually set the timestamp to be older than the expiry time
-        manager._pending_confirmations[confirmation_id]["timestamp"] = time.time() - manager._confirmation_expiry - 10
+        expired_timestamp = time.monotonic() - manager._confirmation_expiry - 10
+        manager._pending_confirmations[confirmation_id]["timestamp"] = expired_timestamp
 
         # Try to retrieve the confirmation
         confirmation = manager._get_confirmation(confirmation_id)
@@ -244,13 +246,13 @@ class TestSafetyManager:
         """Test cleaning up expired confirmations."""
         manager = SafetyManager.get_instance()
 
-        # Store multiple confirmations with different expiration times
-        valid_id = manager._store_confirmation(ClientType.DATABASE, "valid_operation", OperationRiskLevel.EXTREME)
-
+        # Store multiple confirmations with different expiration times, oldest first
         expired_id = manager._store_confirmation(ClientType.DATABASE, "expired_operation", OperationRiskLevel.EXTREME)
 
+        valid_id = manager._store_confirmation(ClientType.DATABASE, "valid_operation", OperationRiskLevel.EXTREME)
+
         # Manually set the timestamp of the expired confirmation to be older than the expiry time
-        manager._pending_confirmations[expired_id]["timestamp"] = time.time() - manager._confirmation_expiry - 10
+        manager._pending_confirmations[expired_id]["timestamp"] = time.monotonic() - manager._confirmation_expiry - 10
 
         # Call cleanup
         manager._cleanup_expired_confirmations()
@@ -294,9 +296,7 @@ class TestSafetyManager:
             # Extract the confirmation ID from the error message
             error_message = str(e)
             # Find the confirmation ID in the message
-            import re
-
-            match = re.search(r"ID: (conf_[a-f0-9]+)", error_message)
+            match = CONFIRMATION_ID_RE.search(error_message)
             if match:
                 confirmation_id = match.group(1)
 
@@ -5,7 +5,7 @@ This file contains unit test cases for the SQLSafetyConfig class, which is respo
 determining the risk level of SQL operations and whether they are allowed or require confirmation.
 """
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -17,63 +17,58 @@ from supabase_mcp.services.safety.safety_configs import SQLSafetyConfig
 class TestSQLSafetyConfig:
     """Unit tests for the SQLSafetyConfig class."""
 
-    def test_get_risk_level(self):
-        """Test that get_risk_level returns the highest_risk_level from the operation."""
-        config = SQLSafetyConfig()
-
-        # Create mock QueryValidationResults objects with different risk levels
-        low_risk_op = MagicMock()
-        low_risk_op.highest_risk_level = OperationRiskLevel.LOW
-
-        medium_risk_op = MagicMock()
-        medium_risk_op.highest_risk_level = OperationRiskLevel.MEDIUM
-
-        high_risk_op = MagicMock()
-        high_risk_op.highest_risk_level = OperationRiskLevel.HIGH
+    @pytest.fixture(scope="class")
+    def config(self):
+        """Create a single SQLSafetyConfig for the class; the config is stateless."""
+        return SQLSafetyConfig()
 
-        extreme_risk_op = MagicMock()
-        extreme_risk_op.highest_risk_level = OperationRiskLevel.EXTREME
+    @pytest.fixture(scope="class")
+    def operations(self):
+        """Stub QueryValidationResults objects keyed by their highest risk level."""
+        return {level: SimpleNamespace(highest_risk_level=level) for level in OperationRiskLevel}
 
-        # Test that the risk level is correctly returned
-        assert config.get_risk_level(low_risk_op) == OperationRiskLevel.LOW
-        assert config.get_risk_level(medium_risk_op) == OperationRiskLevel.MEDIUM
-        assert config.get_risk_level(high_risk_op) == OperationRiskLevel.HIGH
-        assert config.get_risk_level(extreme_risk_op) == OperationRiskLevel.EXTREME
-
-    def test_is_operation_allowed(self):
+    def test_get_risk_level(self, config, operations):
+        """Test that get_risk_level returns the highest_risk_level from the operation."""
+        for level, operation in operations.items():
+            assert config.get_risk_level(operation) == level
+
+    @pytest.mark.parametrize(
+        "risk_level,mode,expected",
+        [
+            # Low risk operations should be allowed in both safe and unsafe modes
+            (OperationRiskLevel.LOW, SafetyMode.SAFE, True),
+            (OperationRiskLevel.LOW, SafetyMode.UNSAFE, True),
+            # Medium/high risk operations should only be allowed in unsafe mode
+            (OperationRiskLevel.MEDIUM, SafetyMode.SAFE, False),
+            (OperationRiskLevel.MEDIUM, SafetyMode.UNSAFE, True),
+            (OperationRiskLevel.HIGH, SafetyMode.SAFE, False),
+            (OperationRiskLevel.HIGH, SafetyMode.UNSAFE, True),
+            # Extreme risk operations are never allowed
+            (OperationRiskLevel.EXTREME, SafetyMode.SAFE, False),
+            (OperationRiskLevel.EXTREME, SafetyMode.UNSAFE, False),
+        ],
+    )
+    def test_is_operation_allowed(self, config, risk_level, mode, expected):
         """Test if operations are allowed based on risk level and safety mode.
 
         This tests the behavior inherited from SafetyConfigBase.
         """
-        config = SQLSafetyConfig()
-
-        # Low risk operations should be allowed in both safe and unsafe modes
-        assert config.is_operation_allowed(OperationRiskLevel.LOW, SafetyMode.SAFE) is True
-        assert config.is_operation_allowed(OperationRiskLevel.LOW, SafetyMode.UNSAFE) is True
-
-        # Medium/high risk operations should only be allowed in unsafe mode
-        assert config.is_operation_allowed(OperationRiskLevel.MEDIUM, SafetyMode.SAFE) is False
-        assert config.is_operation_allowed(OperationRiskLevel.MEDIUM, SafetyMode.UNSAFE) is True
-        assert config.is_operation_allowed(OperationRiskLevel.HIGH, SafetyMode.SAFE) is False
-        assert config.is_operation_allowed(OperationRiskLevel.HIGH, SafetyMode.UNSAFE) is True
-
-        # Extreme risk operations are never allowed
-        assert config.is_operation_allowed(OperationRiskLevel.EXTREME, SafetyMode.SAFE) is False
-        assert config.is_operation_allowed(OperationRiskLevel.EXTREME, SafetyMode.UNSAFE) is False
-
-    def test_needs_confirmation(self):
+        assert config.is_operation_allowed(risk_level, mode) is expected
+
+    @pytest.mark.parametrize(
+        "risk_level,expected",
+        [
+            # Low and medium risk operations should not need confirmation
+            (OperationRiskLevel.LOW, False),
+            (OperationRiskLevel.MEDIUM, False),
+            # High and extreme risk operations should need confirmation
+            (OperationRiskLevel.HIGH, True),
+            (OperationRiskLevel.EXTREME, True),
+        ],
+    )
+    def test_needs_confirmation(self, config, risk_level, expected):
         """Test if operations need confirmation based on risk level.
 
         This tests the behavior inherited from SafetyConfigBase.
         """
-        config = SQLSafetyConfig()
-
-        # Low and medium risk operations should not need confirmation
-        assert config.needs_confirmation(OperationRiskLevel.LOW) is False
-        assert config.needs_confirmation(OperationRiskLevel.MEDIUM) is False
-
-        # High risk operations should need confirmation
-        assert config.needs_confirmation(OperationRiskLevel.HIGH) is True
-
-        # Extreme risk operations should need confirmation
-        assert config.needs_confirmation(OperationRiskLevel.EXTREME) is True
+        assert config.needs_confirmation(risk_level) is expected
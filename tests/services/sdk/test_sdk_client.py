@@ -1,17 +1,33 @@
 import time
 import uuid
+from collections import namedtuple
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from supabase_mcp.clients.sdk_client import SupabaseSDKClient
 from supabase_mcp.exceptions import PythonSDKError
-from supabase_mcp.settings import Settings
 
 # Unique identifier for test users to avoid conflicts
 TEST_ID = f"test-{int(time.time())}-{uuid.uuid4().hex[:6]}"
 
+# Invitation timestamp shared by the invite test; nothing depends on its freshness
+INVITED_AT = datetime.now().isoformat()
+
+
+# Immutable user payloads returned by the mocked auth admin methods
+FakeUser = namedtuple("FakeUser", "id email user_metadata invited_at", defaults=(None,))
+FakeResponse = namedtuple("FakeResponse", "user")
+
+
+class AlwaysRaisingAdmin:
+    """Auth admin stub whose every method raises a validation error."""
+
+    def __getattr__(self, name: str) -> AsyncMock:
+        return AsyncMock(side_effect=Exception("Invalid parameters"))
+
 
 # Create unique test emails
 def get_test_email(prefix: str = "user"):
@@ -19,43 +35,71 @@ def get_test_email(prefix: str = "user"):
     return f"a.zuev+{prefix}-{TEST_ID}@outlook.com"
 
 
+@pytest.fixture(scope="module", autouse=True)
+def patch_create_async_client():
+    """Patch create_async_client once for the module so no test can open a real Supabase client."""
+    with patch("supabase_mcp.clients.sdk_client.create_async_client", return_value=MagicMock()) as mock_create:
+        yield mock_create
+
+
 @pytest.mark.asyncio(loop_scope="module")
 class TestSDKClientIntegration:
     """
     Unit tests for the SupabaseSDKClient.
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_settings(self):
-        """Create mock settings for testing."""
-        settings = MagicMock(spec=Settings)
-        settings.supabase_project_ref = "test-project-ref"
-        settings.supabase_service_role_key = "test-service-role-key"
-        settings.supabase_region = "us-east-1"
-        settings.supabase_url = "https://test-project-ref.supabase.co"
-        return settings
+        """Create stub settings once per class; the SDK client only reads these attributes."""
+        return SimpleNamespace(
+            supabase_project_ref="test-project-ref",
+            supabase_service_role_key="test-service-role-key",
+            supabase_region="us-east-1",
+            supabase_url="https://test-project-ref.supabase.co",
+        )
 
-    @pytest.fixture
-    async def mock_sdk_client(self, mock_settings):
-        """Create a mock SDK client for testing."""
+    @pytest.fixture(scope="class")
+    def mock_sdk_client(self, mock_settings):
+        """Create the SDK client once per class; tests get a fresh mock Supabase client below."""
         # Reset singleton
         SupabaseSDKClient.reset()
-        
-        # Mock the Supabase client
-        mock_supabase = MagicMock()
-        mock_auth_admin = MagicMock()
-        mock_supabase.auth.admin = mock_auth_admin
-        
-        # Mock the create_async_client function to return our mock client
-        with patch('supabase_mcp.clients.sdk_client.create_async_client', return_value=mock_supabase):
-            # Create client - this will now use our mocked create_async_client
-            client = SupabaseSDKClient.get_instance(settings=mock_settings)
-            # Manually set the client to ensure it's available
-            client.client = mock_supabase
-            
-        return client
+        return SupabaseSDKClient.get_instance(settings=mock_settings)
+
+    @pytest.fixture(autouse=True)
+    def fresh_supabase_client(self, mock_sdk_client):
+        """Give each test a clean mock Supabase client so create_async_client is never needed."""
+        mock_sdk_client.client = MagicMock()
+
+    @pytest.fixture(scope="class")
+    def canned_users(self):
+        """Build the user responses returned by the mocked auth admin methods once per class."""
+        return {
+            "get": FakeResponse(
+                FakeUser(str(uuid.uuid4()), get_test_email("get"), {"name": "Test User", "test_id": TEST_ID})
+            ),
+            "create": FakeResponse(
+                FakeUser(str(uuid.uuid4()), get_test_email("create"), {"name": "Test User", "test_id": TEST_ID})
+            ),
+            "update": FakeResponse(
+                FakeUser(str(uuid.uuid4()), get_test_email("update"), {"email": "afterupdated@email.com"})
+            ),
+            "invite": FakeResponse(
+                FakeUser(str(uuid.uuid4()), get_test_email("invite"), {}, invited_at=INVITED_AT)
+            ),
+        }
+
+    @pytest.fixture
+    def set_admin_mock(self, mock_sdk_client):
+        """Return a helper that installs an AsyncMock auth admin method returning `ret` or raising `exc`."""
 
-    async def test_list_users(self, mock_sdk_client: SupabaseSDKClient):
+        def _set(name: str, *, ret=None, exc: Exception | None = None) -> AsyncMock:
+            mock = AsyncMock(side_effect=exc) if exc else AsyncMock(return_value=ret)
+            setattr(mock_sdk_client.client.auth.admin, name, mock)
+            return mock
+
+        return _set
+
+    async def test_list_users(self, mock_sdk_client: SupabaseSDKClient, set_admin_mock):
         """Test listing users with pagination"""
         # Mock user data
         mock_users = [
@@ -64,7 +108,7 @@ class TestSDKClientIntegration:
         ]
         
         # Mock the list_users method as an async function
-        mock_sdk_client.client.auth.admin.list_users = AsyncMock(return_value=mock_users)
+        set_admin_mock("list_users", ret=mock_users)
         
         # Create test parameters
         list_params = {"page": 1, "per_page": 10}
@@ -84,7 +128,7 @@ class TestSDKClientIntegration:
         assert hasattr(first_user, "user_metadata")
 
         # Test with invalid parameters - mock the validation error
-        mock_sdk_client.client.auth.admin.list_users = AsyncMock(side_effect=Exception("Bad Pagination Parameters"))
+        set_admin_mock("list_users", exc=Exception("Bad Pagination Parameters"))
         
         invalid_params = {"page": -1, "per_page": 10}
         with pytest.raises(PythonSDKError) as excinfo:
@@ -92,21 +136,15 @@ class TestSDKClientIntegration:
 
         assert "Bad Pagination Parameters" in str(excinfo.value)
 
-    async def test_get_user_by_id(self, mock_sdk_client: SupabaseSDKClient):
+    async def test_get_user_by_id(self, mock_sdk_client: SupabaseSDKClient, set_admin_mock, canned_users):
         """Test retrieving a user by ID"""
         # Mock user data
-        test_email = get_test_email("get")
-        user_id = str(uuid.uuid4())
-        
-        mock_user = MagicMock(
-            id=user_id,
-            email=test_email,
-            user_metadata={"name": "Test User", "test_id": TEST_ID}
-        )
-        mock_response = MagicMock(user=mock_user)
+        mock_response = canned_users["get"]
+        user_id = mock_response.user.id
+        test_email = mock_response.user.email
         
         # Mock the get_user_by_id method as an async function
-        mock_sdk_client.client.auth.admin.get_user_by_id = AsyncMock(return_value=mock_response)
+        set_admin_mock("get_user_by_id", ret=mock_response)
         
         # Get the user by ID
         get_params = {"uid": user_id}
@@ -119,7 +157,7 @@ class TestSDKClientIntegration:
         assert get_result.user.email == test_email
 
         # Test with invalid parameters (non-existent user ID)
-        mock_sdk_client.client.auth.admin.get_user_by_id = AsyncMock(side_effect=Exception("user_id must be an UUID"))
+        set_admin_mock("get_user_by_id", exc=Exception("user_id must be an UUID"))
         
         invalid_params = {"uid": "non-existent-user-id"}
         with pytest.raises(PythonSDKError) as excinfo:
@@ -127,21 +165,15 @@ class TestSDKClientIntegration:
 
         assert "user_id must be an UUID" in str(excinfo.value)
 
-    async def test_create_user(self, mock_sdk_client: SupabaseSDKClient):
+    async def test_create_user(self, mock_sdk_client: SupabaseSDKClient, set_admin_mock, canned_users):
         """Test creating a new user"""
         # Create a new test user
-        test_email = get_test_email("create")
-        user_id = str(uuid.uuid4())
-        
-        mock_user = MagicMock(
-            id=user_id,
-            email=test_email,
-            user_metadata={"name": "Test User", "test_id": TEST_ID}
-        )
-        mock_response = MagicMock(user=mock_user)
+        mock_response = canned_users["create"]
+        user_id = mock_response.user.id
+        test_email = mock_response.user.email
         
         # Mock the create_user method as an async function
-        mock_sdk_client.client.auth.admin.create_user = AsyncMock(return_value=mock_response)
+        set_admin_mock("create_user", ret=mock_response)
         
         create_params = {
             "email": test_email,
@@ -158,7 +190,7 @@ class TestSDKClientIntegration:
         assert create_result.user.id == user_id
 
         # Test with invalid parameters (missing required fields)
-        mock_sdk_client.client.auth.admin.create_user = AsyncMock(side_effect=Exception("Invalid parameters"))
+        set_admin_mock("create_user", exc=Exception("Invalid parameters"))
         
         invalid_params = {"user_metadata": {"name": "Invalid User"}}
         with pytest.raises(PythonSDKError) as excinfo:
@@ -166,21 +198,14 @@ class TestSDKClientIntegration:
 
         assert "Invalid parameters" in str(excinfo.value)
 
-    async def test_update_user_by_id(self, mock_sdk_client: SupabaseSDKClient):
+    async def test_update_user_by_id(self, mock_sdk_client: SupabaseSDKClient, set_admin_mock, canned_users):
         """Test updating a user's attributes"""
         # Mock user data
-        test_email = get_test_email("update")
-        user_id = str(uuid.uuid4())
-        
-        mock_user = MagicMock(
-            id=user_id,
-            email=test_email,
-            user_metadata={"email": "afterupdated@email.com"}
-        )
-        mock_response = MagicMock(user=mock_user)
+        mock_response = canned_users["update"]
+        user_id = mock_response.user.id
         
         # Mock the update_user_by_id method as an async function
-        mock_sdk_client.client.auth.admin.update_user_by_id = AsyncMock(return_value=mock_response)
+        set_admin_mock("update_user_by_id", ret=mock_response)
         
         # Update the user
         update_params = {
@@ -201,7 +226,7 @@ class TestSDKClientIntegration:
         assert update_result.user.user_metadata["email"] == "afterupdated@email.com"
 
         # Test with invalid parameters (non-existent user ID)
-        mock_sdk_client.client.auth.admin.update_user_by_id = AsyncMock(side_effect=Exception("user_id must be an uuid"))
+        set_admin_mock("update_user_by_id", exc=Exception("user_id must be an uuid"))
         
         invalid_params = {
             "uid": "non-existent-user-id",
@@ -212,13 +237,13 @@ class TestSDKClientIntegration:
 
         assert "user_id must be an uuid" in str(excinfo.value).lower()
 
-    async def test_delete_user(self, mock_sdk_client: SupabaseSDKClient):
+    async def test_delete_user(self, mock_sdk_client: SupabaseSDKClient, set_admin_mock):
         """Test deleting a user"""
         # Mock user data
         user_id = str(uuid.uuid4())
         
         # Mock the delete_user method as an async function to return None (success)
-        mock_sdk_client.client.auth.admin.delete_user = AsyncMock(return_value=None)
+        set_admin_mock("delete_user")
         
         # Delete the user
         delete_params = {"id": user_id}
@@ -227,7 +252,7 @@ class TestSDKClientIntegration:
         assert result is None
 
         # Test with invalid parameters (non-UUID format user ID)
-        mock_sdk_client.client.auth.admin.delete_user = AsyncMock(side_effect=Exception("user_id must be an uuid"))
+        set_admin_mock("delete_user", exc=Exception("user_id must be an uuid"))
         
         invalid_params = {"id": "non-existent-user-id"}
         with pytest.raises(PythonSDKError) as excinfo:
@@ -235,26 +260,19 @@ class TestSDKClientIntegration:
 
         assert "user_id must be an uuid" in str(excinfo.value).lower()
 
-    async def test_invite_user_by_email(self, mock_sdk_client: SupabaseSDKClient):
+    async def test_invite_user_by_email(self, mock_sdk_client: SupabaseSDKClient, set_admin_mock, canned_users):
         """Test inviting a user by email"""
         # Mock user data
-        test_email = get_test_email("invite")
-        user_id = str(uuid.uuid4())
-        
-        mock_user = MagicMock(
-            id=user_id,
-            email=test_email,
-            invited_at=datetime.now().isoformat()
-        )
-        mock_response = MagicMock(user=mock_user)
+        mock_response = canned_users["invite"]
+        test_email = mock_response.user.email
         
         # Mock the invite_user_by_email method as an async function
-        mock_sdk_client.client.auth.admin.invite_user_by_email = AsyncMock(return_value=mock_response)
+        set_admin_mock("invite_user_by_email", ret=mock_response)
         
         # Create invite parameters
         invite_params = {
             "email": test_email,
-            "options": {"data": {"name": "Invited User", "test_id": TEST_ID, "invited_at": datetime.now().isoformat()}},
+            "options": {"data": {"name": "Invited User", "test_id": TEST_ID, "invited_at": INVITED_AT}},
         }
 
         # Invite the user
@@ -267,7 +285,7 @@ class TestSDKClientIntegration:
         assert hasattr(result.user, "invited_at")
 
         # Test with invalid parameters (missing email)
-        mock_sdk_client.client.auth.admin.invite_user_by_email = AsyncMock(side_effect=Exception("Invalid parameters"))
+        set_admin_mock("invite_user_by_email", exc=Exception("Invalid parameters"))
         
         invalid_params = {"options": {"data": {"name": "Invalid Invite"}}}
         with pytest.raises(PythonSDKError) as excinfo:
@@ -275,14 +293,14 @@ class TestSDKClientIntegration:
 
         assert "Invalid parameters" in str(excinfo.value)
 
-    async def test_generate_link(self, mock_sdk_client: SupabaseSDKClient):
+    async def test_generate_link(self, mock_sdk_client: SupabaseSDKClient, set_admin_mock):
         """Test generating authentication links"""
         # Mock response for generate_link
         mock_properties = MagicMock(action_link="https://example.com/auth/link")
         mock_response = MagicMock(properties=mock_properties)
         
         # Mock the generate_link method as an async function
-        mock_sdk_client.client.auth.admin.generate_link = AsyncMock(return_value=mock_response)
+        set_admin_mock("generate_link", ret=mock_response)
         
         # Test signup link
         link_params = {
@@ -304,7 +322,7 @@ class TestSDKClientIntegration:
         assert hasattr(result.properties, "action_link")
 
         # Test with invalid parameters (invalid link type)
-        mock_sdk_client.client.auth.admin.generate_link = AsyncMock(side_effect=Exception("Invalid parameters"))
+        set_admin_mock("generate_link", exc=Exception("Invalid parameters"))
         
         invalid_params = {"type": "invalid_type", "email": get_test_email("invalid")}
         with pytest.raises(PythonSDKError) as excinfo:
@@ -312,10 +330,10 @@ class TestSDKClientIntegration:
 
         assert "Invalid parameters" in str(excinfo.value) or "invalid type" in str(excinfo.value).lower()
 
-    async def test_delete_factor(self, mock_sdk_client: SupabaseSDKClient):
+    async def test_delete_factor(self, mock_sdk_client: SupabaseSDKClient, set_admin_mock):
         """Test deleting an MFA factor"""
         # Mock the delete_factor method as an async function to raise not implemented
-        mock_sdk_client.client.auth.admin.delete_factor = AsyncMock(side_effect=AttributeError("method not found"))
+        set_admin_mock("delete_factor", exc=AttributeError("method not found"))
         
         # Attempt to delete a factor
         delete_factor_params = {"user_id": str(uuid.uuid4()), "id": "non-existent-factor-id"}
@@ -326,34 +344,31 @@ class TestSDKClientIntegration:
         # We expect this to fail with a specific error message
         assert "not implemented" in str(excinfo.value).lower() or "method not found" in str(excinfo.value).lower()
 
-    async def test_empty_parameters(self, mock_sdk_client: SupabaseSDKClient):
+    @pytest.mark.parametrize(
+        "method", ["get_user_by_id", "create_user", "update_user_by_id", "delete_user", "generate_link"]
+    )
+    async def test_empty_parameters(self, mock_sdk_client: SupabaseSDKClient, method):
         """Test validation errors with empty parameters for various methods"""
-        # Test methods with empty parameters
-        methods = ["get_user_by_id", "create_user", "update_user_by_id", "delete_user", "generate_link"]
-
-        for method in methods:
-            empty_params = {}
-            
-            # Mock the method to raise validation error
-            setattr(mock_sdk_client.client.auth.admin, method, AsyncMock(side_effect=Exception("Invalid parameters")))
+        # Every admin method raises a validation error; a mock is only built if the client reaches one
+        mock_sdk_client.client.auth.admin = AlwaysRaisingAdmin()
 
-            # Should raise PythonSDKError containing validation error details
-            with pytest.raises(PythonSDKError) as excinfo:
-                await mock_sdk_client.call_auth_admin_method(method, empty_params)
+        # Should raise PythonSDKError containing validation error details
+        with pytest.raises(PythonSDKError) as excinfo:
+            await mock_sdk_client.call_auth_admin_method(method, {})
 
-            # Verify error message contains validation details
-            assert "Invalid parameters" in str(excinfo.value) or "validation error" in str(excinfo.value).lower()
+        # Verify error message contains validation details
+        assert "Invalid parameters" in str(excinfo.value) or "validation error" in str(excinfo.value).lower()
 
     async def test_client_without_service_role_key(self, mock_settings):
         """Test that an exception is raised when attempting to use the SDK client without a service role key."""
-        # Create settings without service role key
-        mock_settings.supabase_service_role_key = None
+        # Create settings without service role key, leaving the shared settings untouched
+        settings = SimpleNamespace(**{**vars(mock_settings), "supabase_service_role_key": None})
         
         # Reset singleton
         SupabaseSDKClient.reset()
         
         # Create client
-        client = SupabaseSDKClient.get_instance(settings=mock_settings)
+        client = SupabaseSDKClient.get_instance(settings=settings)
 
         # Attempt to call a method - should raise an exception
         with pytest.raises(PythonSDKError) as excinfo:
@@ -1,21 +1,18 @@
-from unittest.mock import patch
-
 import pytest
 from pydantic import ValidationError
 
 from supabase_mcp.settings import SUPPORTED_REGIONS, Settings
 
+# Environment variables read by Settings
+SETTINGS_ENV_VARS = tuple(field.alias for field in Settings.model_fields.values() if field.alias)
+
 
-@pytest.fixture(autouse=True)
-def reset_settings_singleton() -> None:
-    """Reset the Settings singleton before each test"""
-    # Clear singleton instance if it exists
-    if hasattr(Settings, "_instance"):
-        delattr(Settings, "_instance")
-    yield
-    # Clean up after test
-    if hasattr(Settings, "_instance"):
-        delattr(Settings, "_instance")
+@pytest.fixture
+def settings_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Unset the variables Settings reads; monkeypatch undoes only the keys it touched."""
+    for name in SETTINGS_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
 
 
 class TestSettings:
@@ -52,16 +49,13 @@ class TestSettings:
         assert settings.supabase_db_password, "DB password should not be empty"
 
     @pytest.mark.integration
-    def test_settings_from_env_vars(self, clean_environment: None) -> None:
+    def test_settings_from_env_vars(self, clean_environment: None, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test env vars take precedence over config file"""
-        env_values = {
-            "SUPABASE_PROJECT_REF": "abcdefghij1234567890",  # Valid 20-char project ref
-            "SUPABASE_DB_PASSWORD": "env-password",
-        }
-        with patch.dict("os.environ", env_values, clear=False):
-            settings = Settings.with_config(".env.test")  # Even with config file
-            assert settings.supabase_project_ref == "abcdefghij1234567890"
-            assert settings.supabase_db_password == "env-password"
+        monkeypatch.setenv("SUPABASE_PROJECT_REF", "abcdefghij1234567890")  # Valid 20-char project ref
+        monkeypatch.setenv("SUPABASE_DB_PASSWORD", "env-password")
+        settings = Settings.with_config(".env.test")  # Even with config file
+        assert settings.supabase_project_ref == "abcdefghij1234567890"
+        assert settings.supabase_db_password == "env-password"
 
     @pytest.mark.integration
     def test_settings_integration_fixture(self, settings_integration: Settings) -> None:
@@ -72,49 +66,51 @@ class TestSettings:
         assert settings_integration.supabase_region, "Region should not be empty"
 
     @pytest.mark.integration
-    def test_settings_region_validation(self) -> None:
+    def test_settings_region_validation(self, settings_env: pytest.MonkeyPatch) -> None:
         """Test region validation."""
         # Test default region
         settings = Settings()
         assert settings.supabase_region == "us-east-1"
 
         # Test valid region from environment
-        env_values = {"SUPABASE_REGION": "ap-southeast-1"}
-        with patch.dict("os.environ", env_values, clear=True):
-            settings = Settings()
-            assert settings.supabase_region == "ap-southeast-1"
+        settings_env.setenv("SUPABASE_REGION", "ap-southeast-1")
+        settings = Settings()
+        assert settings.supabase_region == "ap-southeast-1"
 
         # Test invalid region
+        settings_env.setenv("SUPABASE_REGION", "invalid-region")
         with pytest.raises(ValidationError) as exc_info:
-            env_values = {"SUPABASE_REGION": "invalid-region"}
-            with patch.dict("os.environ", env_values, clear=True):
-                Settings()
+            Settings()
         assert "Region 'invalid-region' is not supported" in str(exc_info.value)
 
     @pytest.mark.integration
-    def test_supported_regions(self) -> None:
+    @pytest.mark.parametrize("region", SUPPORTED_REGIONS.__args__)
+    def test_supported_regions(self, settings_env: pytest.MonkeyPatch, region: str) -> None:
         """Test that all supported regions are valid."""
-        for region in SUPPORTED_REGIONS.__args__:
-            env_values = {"SUPABASE_REGION": region}
-            with patch.dict("os.environ", env_values, clear=True):
-                settings = Settings()
-                assert settings.supabase_region == region
+        settings_env.setenv("SUPABASE_REGION", region)
+        settings = Settings()
+        assert settings.supabase_region == region
 
     @pytest.mark.integration
-    def test_settings_access_token_and_service_role(self) -> None:
+    @pytest.mark.parametrize(
+        "env,expected",
+        [
+            # Test with environment variables
+            (
+                {"SUPABASE_ACCESS_TOKEN": "test-access-token", "SUPABASE_SERVICE_ROLE_KEY": "test-service-role-key"},
+                {"supabase_access_token": "test-access-token", "supabase_service_role_key": "test-service-role-key"},
+            ),
+            # Test defaults (should be None)
+            ({}, {"supabase_access_token": None, "supabase_service_role_key": None}),
+        ],
+        ids=["from_env", "defaults"],
+    )
+    def test_settings_access_token_and_service_role(
+        self, settings_env: pytest.MonkeyPatch, env: dict[str, str], expected: dict[str, str | None]
+    ) -> None:
         """Test access token and service role key settings."""
-        # Test with environment variables
-        env_values = {
-            "SUPABASE_ACCESS_TOKEN": "test-access-token",
-            "SUPABASE_SERVICE_ROLE_KEY": "test-service-role-key",
-        }
-        with patch.dict("os.environ", env_values, clear=True):
-            settings = Settings()
-            assert settings.supabase_access_token == "test-access-token"
-            assert settings.supabase_service_role_key == "test-service-role-key"
-
-        # Test defaults (should be None)
-        with patch.dict("os.environ", {}, clear=True):
-            settings = Settings()
-            assert settings.supabase_access_token is None
-            assert settings.supabase_service_role_key is None
+        for name, value in env.items():
+            settings_env.setenv(name, value)
+        settings = Settings()
+        for attr, value in expected.items():
+            assert getattr(settings, attr) == value
@@ -1,11 +1,46 @@
-from unittest.mock import MagicMock, mock_open, patch
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from supabase_mcp.tools.manager import ToolManager, ToolName
 
+log = logging.getLogger(__name__)
+
+# Values of every ToolName member
+TOOL_NAME_VALUES = frozenset(tool.value for tool in ToolName)
+
+# Known descriptions for tests that don't need the real YAML files
+SAMPLE_DESCRIPTIONS = {
+    ToolName.GET_SCHEMAS.value: "Description for get_schemas",
+    ToolName.GET_TABLES.value: "Description for get_tables",
+}
+
+
+@pytest.fixture
+def prebuilt_manager() -> ToolManager:
+    """Create a ToolManager with known descriptions, skipping the YAML load."""
+    manager = ToolManager(load=False)
+    manager.descriptions.update(SAMPLE_DESCRIPTIONS)
+    return manager
+
+
+@pytest.fixture(scope="session")
+def loaded_descriptions() -> dict[str, str]:
+    """Load the real YAML tool descriptions once for the session, without touching the singleton."""
+    return dict(ToolManager().descriptions)
+
 
 class TestToolManager:
     """Tests for the ToolManager class."""
 
+    @pytest.fixture(autouse=True)
+    def reset_singleton(self):
+        """Reset the ToolManager singleton around each test, even when an assertion fails."""
+        ToolManager._instance = None
+        yield
+        ToolManager._instance = None
+
     def test_singleton_pattern(self):
         """Test that ToolManager follows the singleton pattern."""
         # Get two instances
@@ -15,13 +50,15 @@ class TestToolManager:
         # They should be the same object
         assert manager1 is manager2
 
-        # Reset the singleton for other tests
-        # pylint: disable=protected-access
-        # We need to reset the singleton for test isolation
-        ToolManager._instance = None  # type: ignore
+    @pytest.fixture
+    def clear_descriptions_cache(self):
+        """Drop cached descriptions after a test that loads them from a patched filesystem."""
+        yield
+        ToolManager._descriptions_cache.clear()
 
     @patch("supabase_mcp.tools.manager.Path")
-    @patch("supabase_mcp.tools.manager.yaml.safe_load")
+    @patch("yaml.load")
+    @pytest.mark.usefixtures("clear_descriptions_cache")
     def test_load_descriptions(self, mock_yaml_load: MagicMock, mock_path: MagicMock):
         """Test that descriptions are loaded correctly from YAML files."""
         # Setup mock directory structure
@@ -47,8 +84,12 @@ class TestToolManager:
         mock_yaml_data = {"get_schemas": "Description for get_schemas", "get_tables": "Description for get_tables"}
         mock_yaml_load.return_value = mock_yaml_data
 
+        # The YAML load is mocked, so open() only needs to return a context manager
+        fake_file = MagicMock()
+        fake_file.__enter__.return_value = fake_file
+
         # Create a new instance to trigger _load_descriptions
-        with patch("builtins.open", mock_open(read_data="dummy yaml content")):
+        with patch("builtins.open", return_value=fake_file):
             # We need to create the manager to trigger _load_descriptions
             ToolManager()
 
@@ -57,73 +98,55 @@ class TestToolManager:
         assert mock_dir.glob.call_args[0][0] == "*.yaml"
         assert mock_yaml_load.call_count >= 1
 
-        # Reset the singleton for other tests
-        # pylint: disable=protected-access
-        ToolManager._instance = None  # type: ignore
+    def test_load_descriptions_reuses_parsed_yaml(self):
+        """Test that unchanged YAML files are parsed only once across instances."""
+        first = ToolManager()
 
-    def test_get_description_valid_tool(self):
-        """Test getting a description for a valid tool."""
-        # Setup
-        manager = ToolManager.get_instance()
+        with patch("yaml.load") as mock_yaml_load:
+            second = ToolManager()
+
+        mock_yaml_load.assert_not_called()
+        assert second.descriptions == first.descriptions
+        # Each instance gets its own dict so tests can replace or mutate it freely
+        assert second.descriptions is not first.descriptions
+
+    def test_reset_keeps_parsed_descriptions(self):
+        """Test that rebuilding the singleton after reset() reuses the parsed YAML."""
+        first = ToolManager.get_instance()
+        ToolManager.reset()
 
-        # Force the descriptions to have a known value for testing
-        # pylint: disable=protected-access
-        # We need to set the descriptions directly for testing
-        manager.descriptions = {
-            ToolName.GET_SCHEMAS.value: "Description for get_schemas",
-            ToolName.GET_TABLES.value: "Description for get_tables",
-        }
+        with patch("yaml.load") as mock_yaml_load:
+            second = ToolManager.get_instance()
 
+        assert second is not first
+        mock_yaml_load.assert_not_called()
+        assert second.descriptions == first.descriptions
+
+    def test_get_description_valid_tool(self, prebuilt_manager: ToolManager):
+        """Test getting a description for a valid tool."""
         # Test
-        description = manager.get_description(ToolName.GET_SCHEMAS.value)
+        description = prebuilt_manager.get_description(ToolName.GET_SCHEMAS.value)
 
         # Verify
         assert description == "Description for get_schemas"
 
-        # Reset the singleton for other tests
-        # pylint: disable=protected-access
-        ToolManager._instance = None  # type: ignore
-
-    def test_get_description_invalid_tool(self):
+    def test_get_description_invalid_tool(self, prebuilt_manager: ToolManager):
         """Test getting a description for an invalid tool."""
-        # Setup
-        manager = ToolManager.get_instance()
-
-        # Force the descriptions to have a known value for testing
-        # pylint: disable=protected-access
-        # We need to set the descriptions directly for testing
-        manager.descriptions = {
-            ToolName.GET_SCHEMAS.value: "Description for get_schemas",
-            ToolName.GET_TABLES.value: "Description for get_tables",
-        }
-
         # Test and verify
-        description = manager.get_description("nonexistent_tool")
+        description = prebuilt_manager.get_description("nonexistent_tool")
         assert description == ""  # The method returns an empty string for unknown tools
 
-        # Reset the singleton for other tests
-        # pylint: disable=protected-access
-        ToolManager._instance = None  # type: ignore
-
-    def test_all_tool_names_have_descriptions(self):
+    def test_all_tool_names_have_descriptions(self, loaded_descriptions: dict[str, str]):
         """Test that all tools defined in ToolName enum have descriptions."""
-        # Setup - get a fresh instance
-        # Reset the singleton first to ensure we get a clean instance
-        # pylint: disable=protected-access
-        ToolManager._instance = None  # type: ignore
-
-        # Get a fresh instance that will load the real YAML files
-        manager = ToolManager.get_instance()
-
-        # Print the loaded descriptions for debugging
-        print(f"\nLoaded descriptions: {manager.descriptions}")
+        # Log the loaded descriptions for debugging
+        log.debug("Loaded descriptions: %s", loaded_descriptions)
 
         # Verify that we have at least some descriptions loaded
-        assert len(manager.descriptions) > 0, "No descriptions were loaded"
+        assert len(loaded_descriptions) > 0, "No descriptions were loaded"
 
         # Check that descriptions are not empty
         empty_descriptions: list[str] = []
-        for tool_name, description in manager.descriptions.items():
+        for tool_name, description in loaded_descriptions.items():
             if not description or len(description.strip()) == 0:
                 empty_descriptions.append(tool_name)
 
@@ -134,24 +157,20 @@ class TestToolManager:
         found_descriptions = 0
         missing_descriptions: list[str] = []
 
-        for tool_name in ToolName:
-            description = manager.get_description(tool_name.value)
+        for tool_name in TOOL_NAME_VALUES:
+            description = loaded_descriptions.get(tool_name, "")
             if description:
                 found_descriptions += 1
             else:
-                missing_descriptions.append(tool_name.value)
+                missing_descriptions.append(tool_name)
 
-        # Print missing descriptions for debugging
+        # Log missing descriptions for debugging
         if missing_descriptions:
-            print(f"\nMissing descriptions for: {missing_descriptions}")
+            log.debug("Missing descriptions for: %s", missing_descriptions)
 
         # We should have at least some descriptions
         assert found_descriptions > 0, "No tool has a description"
 
-        # Reset the singleton for other tests
-        # pylint: disable=protected-access
-        ToolManager._instance = None  # type: ignore
-
     @patch.object(ToolManager, "_load_descriptions")
     def test_initialization_loads_descriptions(self, mock_load_descriptions: MagicMock):
         """Test that descriptions are loaded during initialization."""
@@ -162,23 +181,22 @@ class TestToolManager:
         # Verify _load_descriptions was called
         assert mock_load_descriptions.call_count > 0
 
-        # Reset the singleton for other tests
-        # pylint: disable=protected-access
-        ToolManager._instance = None  # type: ignore
+    @patch.object(ToolManager, "_load_descriptions")
+    def test_initialization_without_load(self, mock_load_descriptions: MagicMock):
+        """Test that load=False skips loading descriptions."""
+        manager = ToolManager(load=False)
+
+        mock_load_descriptions.assert_not_called()
+        assert manager.descriptions == {}
 
     def test_tool_enum_completeness(self):
         """Test that the ToolName enum contains all expected tools."""
-        # Get all tool values from the enum
-        tool_values = [tool.value for tool in ToolName]
-
         # Verify the total number of tools
         # Update this number when new tools are added
         expected_tool_count = 12
-        assert len(tool_values) == expected_tool_count, f"Expected {expected_tool_count} tools, got {len(tool_values)}"
+        assert len(TOOL_NAME_VALUES) == expected_tool_count, (
+            f"Expected {expected_tool_count} tools, got {len(TOOL_NAME_VALUES)}"
+        )
 
         # Verify specific tools are included
-        assert "retrieve_logs" in tool_values, "retrieve_logs tool is missing from ToolName enum"
-
-        # Reset the singleton for other tests
-        # pylint: disable=protected-access
-        ToolManager._instance = None  # type: ignore
+        assert "retrieve_logs" in TOOL_NAME_VALUES, "retrieve_logs tool is missing from ToolName enum"
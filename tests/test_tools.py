@@ -1,6 +1,5 @@
 """Unit tests for tools - no external dependencies."""
-import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 from mcp.server.fastmcp import FastMCP
@@ -10,30 +9,39 @@ from supabase_mcp.exceptions import ConfirmationRequiredError, OperationNotAllow
 from supabase_mcp.services.database.postgres_client import QueryResult, StatementResult
 from supabase_mcp.services.safety.models import ClientType, OperationRiskLevel, SafetyMode
 
+# Placeholder identifier for mocks that accept any string
+FAKE_UUID = "00000000-0000-4000-8000-000000000000"
+
+# All tests in this module share one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
-@pytest.mark.asyncio
 class TestDatabaseToolsUnit:
     """Unit tests for database tools."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_container(self):
-        """Create a mock container with all necessary services."""
+        """Create a mock container with all necessary services once per class."""
         container = MagicMock(spec=ServicesContainer)
         
         # Mock query manager
         container.query_manager = MagicMock()
         container.query_manager.handle_query = AsyncMock()
-        container.query_manager.get_schemas_query = MagicMock(return_value="SELECT * FROM schemas")
-        container.query_manager.get_tables_query = MagicMock(return_value="SELECT * FROM tables")
-        container.query_manager.get_table_schema_query = MagicMock(return_value="SELECT * FROM columns")
         
         # Mock safety manager
         container.safety_manager = MagicMock()
-        container.safety_manager.check_permission = MagicMock()
-        container.safety_manager.is_unsafe_mode = MagicMock(return_value=False)
         
         return container
 
+    @pytest.fixture(autouse=True)
+    def reset_container(self, mock_container):
+        """Clear state left by the previous test and restore the default return values."""
+        mock_container.reset_mock(return_value=True, side_effect=True)
+        mock_container.query_manager.get_schemas_query.return_value = "SELECT * FROM schemas"
+        mock_container.query_manager.get_tables_query.return_value = "SELECT * FROM tables"
+        mock_container.query_manager.get_table_schema_query.return_value = "SELECT * FROM columns"
+        mock_container.safety_manager.is_unsafe_mode.return_value = False
+
     async def test_get_schemas_returns_query_result(self, mock_container):
         """Test that get_schemas returns proper QueryResult."""
         # Setup mock response
@@ -69,7 +77,7 @@ class TestDatabaseToolsUnit:
         result = await mock_container.query_manager.handle_query(query)
         
         # Verify
-        mock_container.query_manager.get_tables_query.assert_called_with("public")
+        assert mock_container.query_manager.get_tables_query.call_args == call("public")
         assert result.results[0].rows[0]["table_name"] == "users"
 
     async def test_unsafe_query_blocked_in_safe_mode(self, mock_container):
@@ -88,28 +96,30 @@ class TestDatabaseToolsUnit:
             )
 
 
-@pytest.mark.asyncio
 class TestAPIToolsUnit:
     """Unit tests for API tools."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_container(self):
-        """Create a mock container with API services."""
+        """Create a mock container with API services once per class."""
         container = MagicMock(spec=ServicesContainer)
         
         # Mock API manager
         container.api_manager = MagicMock()
         container.api_manager.send_request = AsyncMock()
-        container.api_manager.spec_manager = MagicMock()
-        container.api_manager.spec_manager.get_full_spec = MagicMock(return_value={"paths": {}})
         
         # Mock safety manager
         container.safety_manager = MagicMock()
-        container.safety_manager.check_permission = MagicMock()
-        container.safety_manager.is_unsafe_mode = MagicMock(return_value=False)
         
         return container
 
+    @pytest.fixture(autouse=True)
+    def reset_container(self, mock_container):
+        """Clear state left by the previous test and restore the default return values."""
+        mock_container.reset_mock(return_value=True, side_effect=True)
+        mock_container.api_manager.spec_manager.get_full_spec.return_value = {"paths": {}}
+        mock_container.safety_manager.is_unsafe_mode.return_value = False
+
     async def test_api_request_success(self, mock_container):
         """Test successful API request."""
         # Setup
@@ -162,24 +172,28 @@ class TestAPIToolsUnit:
         assert "requires confirmation" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 class TestAuthToolsUnit:
     """Unit tests for auth tools."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_container(self):
-        """Create a mock container with SDK client."""
+        """Create a mock container with SDK client once per class."""
         container = MagicMock(spec=ServicesContainer)
         
         # Mock SDK client
         container.sdk_client = MagicMock()
         container.sdk_client.call_auth_admin_method = AsyncMock()
-        container.sdk_client.return_python_sdk_spec = MagicMock(return_value={
-            "methods": ["list_users", "create_user", "delete_user"]
-        })
         
         return container
 
+    @pytest.fixture(autouse=True)
+    def reset_container(self, mock_container):
+        """Clear state left by the previous test and restore the default return values."""
+        mock_container.reset_mock(return_value=True, side_effect=True)
+        mock_container.sdk_client.return_python_sdk_spec.return_value = {
+            "methods": ["list_users", "create_user", "delete_user"]
+        }
+
     async def test_list_users_success(self, mock_container):
         """Test listing users successfully."""
         # Setup
@@ -216,7 +230,7 @@ class TestAuthToolsUnit:
     async def test_create_user_validation(self, mock_container):
         """Test user creation with validation."""
         # Setup
-        new_user = {"id": str(uuid.uuid4()), "email": "new@test.com"}
+        new_user = {"id": FAKE_UUID, "email": "new@test.com"}
         mock_container.sdk_client.call_auth_admin_method.return_value = {"user": new_user}
         
         # Execute
@@ -227,52 +241,54 @@ class TestAuthToolsUnit:
         
         # Verify
         assert result["user"]["email"] == "new@test.com"
-        mock_container.sdk_client.call_auth_admin_method.assert_called_once()
+        assert mock_container.sdk_client.call_auth_admin_method.call_count == 1
 
 
-@pytest.mark.asyncio
 class TestSafetyToolsUnit:
     """Unit tests for safety tools - these already work well."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_container(self):
-        """Create a mock container with safety manager."""
+        """Create a mock container with safety manager once per class."""
         container = MagicMock(spec=ServicesContainer)
         
-        # Mock safety manager with proper methods
+        # Mock safety manager
         container.safety_manager = MagicMock()
-        container.safety_manager.set_unsafe_mode = MagicMock()
-        container.safety_manager.get_mode = MagicMock(return_value=SafetyMode.SAFE)
-        container.safety_manager.confirm_operation = MagicMock()
-        container.safety_manager.is_unsafe_mode = MagicMock(return_value=False)
         
         return container
 
-    async def test_live_dangerously_enables_unsafe_mode(self, mock_container):
-        """Test that live_dangerously enables unsafe mode."""
-        # Execute
-        mock_container.safety_manager.set_unsafe_mode(ClientType.DATABASE, True)
-        
-        # Verify
-        mock_container.safety_manager.set_unsafe_mode.assert_called_with(ClientType.DATABASE, True)
+    @pytest.fixture(autouse=True)
+    def reset_container(self, mock_container):
+        """Clear state left by the previous test and restore the default return values."""
+        mock_container.reset_mock(return_value=True, side_effect=True)
+        mock_container.safety_manager.get_mode.return_value = SafetyMode.SAFE
+        mock_container.safety_manager.is_unsafe_mode.return_value = False
 
     async def test_confirm_operation_stores_confirmation(self, mock_container):
         """Test that confirm operation stores the confirmation."""
         # Setup
-        confirmation_id = str(uuid.uuid4())
+        confirmation_id = FAKE_UUID
         
         # Execute
         mock_container.safety_manager.confirm_operation(confirmation_id)
         
         # Verify
-        mock_container.safety_manager.confirm_operation.assert_called_with(confirmation_id)
+        assert mock_container.safety_manager.confirm_operation.call_args == call(confirmation_id)
 
-    async def test_safety_mode_switching(self, mock_container):
-        """Test switching between safe and unsafe modes."""
-        # Test enabling unsafe mode
-        mock_container.safety_manager.set_unsafe_mode(ClientType.API, True)
-        mock_container.safety_manager.set_unsafe_mode.assert_called_with(ClientType.API, True)
+    @pytest.mark.parametrize(
+        "client_type,unsafe",
+        [
+            # live_dangerously enables unsafe mode
+            (ClientType.DATABASE, True),
+            # Switching between safe and unsafe modes
+            (ClientType.API, True),
+            (ClientType.API, False),
+        ],
+    )
+    async def test_set_unsafe_mode(self, mock_container, client_type, unsafe):
+        """Test enabling and disabling unsafe mode for a client."""
+        # Execute
+        mock_container.safety_manager.set_unsafe_mode(client_type, unsafe)
         
-        # Test disabling unsafe mode
-        mock_container.safety_manager.set_unsafe_mode(ClientType.API, False)
-        mock_container.safety_manager.set_unsafe_mode.assert_called_with(ClientType.API, False)
\ No newline at end of file
+        # Verify
+        assert mock_container.safety_manager.set_unsafe_mode.call_args == call(client_type, unsafe)